@@ -0,0 +1,202 @@
+"""Monte Carlo balancing runs for the level difficulty curve.
+
+Plays many seeded headless games with scripted bots across a process pool
+and writes per-level survival, score rate and cause-of-hit statistics as
+CSV (one row per policy and level).
+
+Usage:
+    python -m ai.balance --runs 2000 --output balance.csv
+    python -m ai.balance --set speed_per_level=0.15 --policy aim
+"""
+
+import argparse
+import csv
+import multiprocessing
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+
+from game.game import DIFFICULTY, Game
+
+from .bots import POLICIES, make_policy
+
+COLUMNS = (
+    "policy",
+    "level",
+    "runs",
+    "cleared",
+    "died",
+    "timed_out",
+    "mean_survival_s",
+    "median_survival_s",
+    "score_per_min",
+    "hits_per_min",
+    "hit_causes",
+    "death_causes",
+)
+
+_GAME = None
+
+
+def _init_worker(difficulty):
+    global _GAME
+    _GAME = Game(headless=True, difficulty=difficulty)
+
+
+def _new_record(level, game):
+    return {
+        "level": level,
+        "start_tick": game.ticks,
+        "start_score": game.score,
+        "hits": Counter(),
+        "outcome": "timed_out",
+        "death": None,
+    }
+
+
+def _close_record(record, game, outcome):
+    record["ticks"] = game.ticks - record.pop("start_tick")
+    record["score"] = game.score - record.pop("start_score")
+    record["outcome"] = outcome
+    return record
+
+
+def run_episode(task):
+    """Play one seeded game with a bot; return (policy, per-level records)."""
+    seed, policy, max_ticks = task
+    game = _GAME
+    game.reset(seed)
+    game.input = make_policy(policy, game, seed)
+
+    records = []
+    record = _new_record(game.level, game)
+    while game.ticks < max_ticks and not game.game_over:
+        level = game.level
+        # A hit stamps last_hit_time; comparing lives would miss hits that
+        # an extra-life power-up made up for.
+        last_hit_time = game.player.last_hit_time
+        game.update()
+        if game.player.last_hit_time != last_hit_time:
+            cause = "{}-{}".format(*game.last_hit)
+            record["hits"][cause] += 1
+            if game.game_over:
+                record["death"] = cause
+        if game.level != level:
+            records.append(_close_record(record, game, "cleared"))
+            record = _new_record(game.level, game)
+    outcome = "died" if game.game_over else "timed_out"
+    records.append(_close_record(record, game, outcome))
+    return policy, records
+
+
+def aggregate(results, tick_rate):
+    """Fold per-run level records into one report row per (policy, level)."""
+    groups = defaultdict(list)
+    for policy, records in results:
+        for record in records:
+            groups[policy, record["level"]].append(record)
+
+    rows = []
+    for (policy, level), records in sorted(groups.items()):
+        seconds = [record["ticks"] / tick_rate for record in records]
+        minutes = sum(seconds) / 60
+        outcomes = Counter(record["outcome"] for record in records)
+        hits = Counter()
+        for record in records:
+            hits.update(record["hits"])
+        deaths = Counter(record["death"] for record in records if record["death"])
+        rows.append(
+            {
+                "policy": policy,
+                "level": level,
+                "runs": len(records),
+                "cleared": outcomes["cleared"],
+                "died": outcomes["died"],
+                "timed_out": outcomes["timed_out"],
+                "mean_survival_s": round(statistics.fmean(seconds), 3),
+                "median_survival_s": round(statistics.median(seconds), 3),
+                "score_per_min": _per_minute(
+                    sum(record["score"] for record in records), minutes
+                ),
+                "hits_per_min": _per_minute(sum(hits.values()), minutes),
+                "hit_causes": _format_counter(hits),
+                "death_causes": _format_counter(deaths),
+            }
+        )
+    return rows
+
+
+def _per_minute(total, minutes):
+    return round(total / minutes, 3) if minutes else 0.0
+
+
+def _format_counter(counter):
+    return ";".join(f"{key}:{count}" for key, count in counter.most_common())
+
+
+def _parse_override(text):
+    key, _, value = text.partition("=")
+    if key not in DIFFICULTY:
+        raise argparse.ArgumentTypeError(
+            f"unknown difficulty key {key!r} (choose from {', '.join(DIFFICULTY)})"
+        )
+    return key, type(DIFFICULTY[key])(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200, help="games per policy")
+    parser.add_argument("--policy", action="append", choices=POLICIES)
+    parser.add_argument("--max-ticks", type=int, default=60 * 60 * 5)
+    parser.add_argument("--seed", type=int, default=0, help="first game seed")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        type=_parse_override,
+        default=[],
+        metavar="KEY=VALUE",
+        help="override a DIFFICULTY setting",
+    )
+    parser.add_argument("--output", help="write the CSV report here (default stdout)")
+    args = parser.parse_args(argv)
+
+    difficulty = dict(args.overrides)
+    policies = args.policy or list(POLICIES)
+    tasks = [
+        (args.seed + run, policy, args.max_ticks)
+        for policy in policies
+        for run in range(args.runs)
+    ]
+
+    start = time.perf_counter()
+    if args.workers <= 1:
+        _init_worker(difficulty)
+        results = [run_episode(task) for task in tasks]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(args.workers, _init_worker, (difficulty,)) as pool:
+            chunksize = max(1, len(tasks) // (args.workers * 8))
+            results = list(pool.imap_unordered(run_episode, tasks, chunksize))
+    elapsed = time.perf_counter() - start
+
+    rows = aggregate(results, tick_rate=60)
+    handle = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        writer = csv.DictWriter(handle, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    finally:
+        if args.output:
+            handle.close()
+    print(
+        f"{len(tasks)} games in {elapsed:.1f}s on {args.workers} worker(s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
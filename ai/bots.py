@@ -0,0 +1,66 @@
+"""Scripted bot policies for simulations and balancing runs."""
+
+import math
+
+from game.controls import Controls, InputSource, RandomInput
+
+
+class SpinnerBot(InputSource):
+    """Turns in place and fires on a fixed cadence."""
+
+    def __init__(self, fire_every=6):
+        self.fire_every = fire_every
+        self.tick = 0
+
+    def poll(self):
+        self.tick += 1
+        return Controls(False, True, False, False, self.tick % self.fire_every == 0)
+
+
+class AimBot(InputSource):
+    """Turns towards the nearest asteroid and fires once roughly on target.
+
+    ``game`` must be set before the first poll.
+    """
+
+    def __init__(self, game=None, fire_every=4, tolerance=10):
+        self.game = game
+        self.fire_every = fire_every
+        self.tolerance = tolerance
+        self.tick = 0
+
+    def poll(self):
+        self.tick += 1
+        game = self.game
+        field = game.asteroids
+        count = len(field)
+        if count == 0:
+            return Controls(False, False, False, True, False)
+        player = game.player
+        delta = field.positions[:count] - (player.position.x, player.position.y)
+        target = delta[(delta * delta).sum(axis=1).argmin()]
+        # Ship angle 0 points up, angles grow clockwise.
+        wanted = math.degrees(math.atan2(target[1], target[0])) + 90
+        error = (wanted - player.angle + 180) % 360 - 180
+        on_target = abs(error) <= self.tolerance
+        return Controls(
+            error < -self.tolerance,
+            error > self.tolerance,
+            False,
+            True,
+            on_target and self.tick % self.fire_every == 0,
+        )
+
+
+POLICIES = ("random", "spinner", "aim")
+
+
+def make_policy(name, game, seed):
+    """Build the named policy for a game."""
+    if name == "random":
+        return RandomInput(seed)
+    if name == "aim":
+        return AimBot(game)
+    if name == "spinner":
+        return SpinnerBot()
+    raise ValueError(f"unknown policy: {name!r}")
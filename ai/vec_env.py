@@ -0,0 +1,202 @@
+"""Batched headless environments for training and evaluating agents.
+
+Each environment is a headless ``Game`` driven one tick per step. Actions
+are integers whose bits are the Controls fields (left, right, thrust,
+brake, shoot), i.e. the same byte the replay format stores.
+"""
+
+import multiprocessing
+import random
+
+import numpy as np
+
+from game.controls import NO_CONTROLS, InputSource
+from game.game import Game
+from game.replay import decode_controls
+
+ACTION_COUNT = 32
+# Every action decoded once, so stepping never builds tuples.
+ACTIONS = tuple(decode_controls(action) for action in range(ACTION_COUNT))
+
+SHIP_FEATURES = 7  # x, y, vx, vy, sin(angle), cos(angle), lives
+ASTEROID_FEATURES = 5  # dx, dy, vx, vy, size
+
+
+class ActionInput(InputSource):
+    """Input source whose Controls are set by the environment each step."""
+
+    def __init__(self):
+        self.controls = NO_CONTROLS
+
+    def poll(self):
+        return self.controls
+
+
+def observe(game, nearest, out):
+    """Write ship state and the nearest asteroids' features into ``out``."""
+    player = game.player
+    width, height = game.world_size
+    angle = np.radians(player.angle)
+    out[:SHIP_FEATURES] = (
+        player.position.x / width,
+        player.position.y / height,
+        player.velocity.x,
+        player.velocity.y,
+        np.sin(angle),
+        np.cos(angle),
+        player.lives,
+    )
+    out[SHIP_FEATURES:] = 0.0
+    field = game.asteroids
+    count = len(field)
+    if count == 0:
+        return
+    delta = field.positions[:count] - (player.position.x, player.position.y)
+    distance = (delta * delta).sum(axis=1)
+    take = min(nearest, count)
+    closest = np.argpartition(distance, take - 1)[:take]
+    closest = closest[np.argsort(distance[closest])]
+    features = out[SHIP_FEATURES:].reshape(nearest, ASTEROID_FEATURES)
+    features[:take, 0] = delta[closest, 0] / width
+    features[:take, 1] = delta[closest, 1] / height
+    features[:take, 2:4] = field.velocities[closest]
+    features[:take, 4] = field.sizes[closest] / 80
+
+
+class EnvBatch:
+    """A group of environments stepped in lockstep inside one process.
+
+    Each environment draws its episode seeds from its own stream, seeded
+    by ``env_seeds``, so it plays the same episodes whichever batch (and
+    process) it ends up in.
+    """
+
+    def __init__(self, env_seeds, max_ticks, nearest):
+        num_envs = len(env_seeds)
+        self.seeds = [random.Random(seed) for seed in env_seeds]
+        self.max_ticks = max_ticks
+        self.nearest = nearest
+        self.inputs = [ActionInput() for _ in range(num_envs)]
+        self.games = [
+            Game(headless=True, input_source=source, seed=seeds.getrandbits(63))
+            for source, seeds in zip(self.inputs, self.seeds)
+        ]
+        size = SHIP_FEATURES + ASTEROID_FEATURES * nearest
+        self.observations = np.zeros((num_envs, size), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+
+    def reset(self):
+        for index, game in enumerate(self.games):
+            game.reset(self.seeds[index].getrandbits(63))
+            observe(game, self.nearest, self.observations[index])
+        return self.observations.copy()
+
+    def step(self, actions):
+        for index, (game, source, action) in enumerate(
+            zip(self.games, self.inputs, actions)
+        ):
+            source.controls = ACTIONS[action]
+            score = game.score
+            game.update()
+            self.rewards[index] = game.score - score
+            done = game.game_over or game.ticks >= self.max_ticks
+            self.dones[index] = done
+            if done:
+                # Finished environments restart straight away; the caller
+                # sees the first observation of the next episode.
+                game.reset(self.seeds[index].getrandbits(63))
+            observe(game, self.nearest, self.observations[index])
+        return self.observations.copy(), self.rewards.copy(), self.dones.copy()
+
+
+def _worker(connection, env_seeds, max_ticks, nearest):
+    batch = EnvBatch(env_seeds, max_ticks, nearest)
+    while True:
+        command, payload = connection.recv()
+        if command == "step":
+            connection.send(batch.step(payload))
+        elif command == "reset":
+            connection.send(batch.reset())
+        elif command == "close":
+            connection.close()
+            return
+
+
+class VectorEnv:
+    """Steps ``num_envs`` independent games from an action array.
+
+    ``step`` returns (observations, rewards, dones) as NumPy arrays of
+    shape (num_envs, observation_size), (num_envs,) and (num_envs,).
+    Rewards are the score gained during the tick. With ``workers > 1`` the
+    environments are split across that many processes.
+    """
+
+    def __init__(self, num_envs, seed=0, max_ticks=3600, nearest=4, workers=1):
+        self.num_envs = num_envs
+        self.observation_size = SHIP_FEATURES + ASTEROID_FEATURES * nearest
+        self.action_count = ACTION_COUNT
+        self.steps = 0
+        self.batch = None
+        self.connections = []
+        self.processes = []
+        self.slices = []
+        # One seed stream per environment, drawn up front so that results
+        # don't depend on how the environments are sharded.
+        seeds = random.Random(seed)
+        env_seeds = [seeds.getrandbits(63) for _ in range(num_envs)]
+        if workers <= 1:
+            self.batch = EnvBatch(env_seeds, max_ticks, nearest)
+            return
+
+        bounds = np.linspace(0, num_envs, workers + 1).astype(int)
+        context = multiprocessing.get_context("spawn")
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            if start == stop:
+                continue
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker,
+                args=(child, env_seeds[start:stop], max_ticks, nearest),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+            self.slices.append(slice(start, stop))
+
+    def reset(self):
+        """Restart every environment and return the first observations."""
+        if self.batch is not None:
+            return self.batch.reset()
+        for connection in self.connections:
+            connection.send(("reset", None))
+        return np.concatenate([connection.recv() for connection in self.connections])
+
+    def step(self, actions):
+        """Advance every environment one tick with the given actions."""
+        actions = np.asarray(actions, dtype=np.int64)
+        self.steps += self.num_envs
+        if self.batch is not None:
+            return self.batch.step(actions.tolist())
+        for connection, part in zip(self.connections, self.slices):
+            connection.send(("step", actions[part].tolist()))
+        results = [connection.recv() for connection in self.connections]
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+    def close(self):
+        """Stop the worker processes."""
+        for connection in self.connections:
+            connection.send(("close", None))
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
@@ -0,0 +1,112 @@
+"""Measure the memory cost of each entity representation.
+
+Builds ``--count`` entities of every kind and reports the bytes traced by
+tracemalloc per entity, including the reference held by the container.
+Shared data (sprites, kind tables) is warmed up first, so only what each
+entity costs on its own is counted.
+
+Usage:
+    python -m benchmarks.memory --count 10000
+    python -m benchmarks.memory --output memory.json
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+from entities.asteroid import ASTEROID_SIZES, Asteroid
+from entities.asteroid_field import AsteroidField
+from entities.bullet import Bullet, BulletPool
+from entities.powerup import POWER_UP_TYPES, PowerUp
+
+
+def asteroid_objects(count):
+    return [
+        Asteroid((index % 1280, index % 800), ASTEROID_SIZES["MD"], (255, 0, 0), (1, 1))
+        for index in range(count)
+    ]
+
+
+def asteroid_field(count):
+    field = AsteroidField(capacity=count)
+    for index in range(count):
+        position = (index % 1280, index % 800)
+        field.add(position, ASTEROID_SIZES["MD"], (255, 0, 0), (1, 1))
+    return field
+
+
+def bullet_objects(count):
+    return [
+        Bullet((index % 1280, index % 800), (0, 10), (255, 255, 255))
+        for index in range(count)
+    ]
+
+
+def bullet_pool(count):
+    pool = BulletPool(capacity=count)
+    for index in range(count):
+        pool.spawn((index % 1280, index % 800), (0, 10))
+    return pool
+
+
+def power_up_objects(count):
+    return [
+        PowerUp(
+            (index % 1280, index % 800), POWER_UP_TYPES[index % len(POWER_UP_TYPES)]
+        )
+        for index in range(count)
+    ]
+
+
+# name -> builder returning ``count`` live entities
+ENTITIES = {
+    "asteroid_objects": asteroid_objects,
+    "asteroid_field_rows": asteroid_field,
+    "bullet_objects": bullet_objects,
+    "bullet_pool_slots": bullet_pool,
+    "power_up_objects": power_up_objects,
+}
+
+
+def bytes_per_entity(build, count):
+    """Return the traced bytes per entity of build(count)."""
+    build(16)  # Fill caches so they aren't charged to the measurement
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities = build(count)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--entity", action="append", choices=sorted(ENTITIES))
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = {
+        "count": args.count,
+        "bytes_per_entity": {
+            name: round(bytes_per_entity(ENTITIES[name], args.count), 1)
+            for name in args.entity or ENTITIES
+        },
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
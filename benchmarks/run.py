@@ -0,0 +1,136 @@
+"""Time the per-frame hot paths of Game across stress scenarios.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json --tolerance 0.15
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from game import snapshot
+
+from .scenarios import SCENARIOS, TARGETS
+
+
+def time_target(build, fresh, target, seed, repeats, warmup):
+    """Return per-call timings (seconds) of one Game method."""
+    timings = []
+    game = None
+    for _ in range(repeats):
+        if game is None or fresh:
+            game = build(seed)
+            if not fresh:
+                state = snapshot.dumps(game)
+                # Let caches (sprites, text, grid buckets) fill first.
+                for _ in range(warmup):
+                    getattr(game, target)()
+        if not fresh:
+            # Every call starts from the built state; otherwise e.g. the
+            # bullets of bullets_500 fly off-screen as the repeats go on.
+            snapshot.loads(game, state)
+        method = getattr(game, target)
+        start = time.perf_counter()
+        method()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings):
+    """Reduce raw timings to microsecond statistics."""
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "median_us": statistics.median(ordered) * 1e6,
+        "mean_us": statistics.fmean(ordered) * 1e6,
+        "p95_us": p95 * 1e6,
+        "min_us": ordered[0] * 1e6,
+        "calls": len(ordered),
+    }
+
+
+def run(scenarios, seed, repeats, warmup=5):
+    results = {}
+    for name in scenarios:
+        build, fresh = SCENARIOS[name]
+        results[name] = {
+            target: summarize(
+                time_target(build, fresh, target, seed, repeats, warmup)
+            )
+            for target in TARGETS
+        }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "seed": seed,
+            "repeats": repeats,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Print median ratios against a baseline; return the regressions."""
+    regressions = []
+    for name, targets in current["results"].items():
+        for target, stats in targets.items():
+            base = baseline["results"].get(name, {}).get(target)
+            if base is None or base["median_us"] <= 0:
+                continue
+            ratio = stats["median_us"] / base["median_us"]
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = "  REGRESSION"
+                regressions.append((name, target, ratio))
+            print(
+                f"{name:<20} {target:<26} {base['median_us']:>10.1f}us "
+                f"-> {stats['median_us']:>10.1f}us  x{ratio:.2f}{flag}"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a previous JSON result")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="allowed median slowdown before a comparison fails (0.10 = 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = args.scenario or list(SCENARIOS)
+    results = run(scenarios, args.seed, args.repeats, args.warmup)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
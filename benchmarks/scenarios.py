@@ -0,0 +1,121 @@
+"""Reproducible game states used by the benchmark runner."""
+
+import math
+import random
+
+from entities.asteroid import ASTEROID_SIZES, Asteroid
+from entities.asteroid_field import AsteroidField
+from entities.bullet import BulletPool
+from entities.particles import ParticleSystem
+from entities.powerup import PowerUpSpawner
+from game.controls import InputSource
+from game.game import Game
+
+
+def new_game(seed):
+    """Return a headless, seeded Game with idle input."""
+    return Game(headless=True, input_source=InputSource(), seed=seed)
+
+
+def at_level(level):
+    """Build the asteroid field create_asteroids produces for a level."""
+
+    def build(seed):
+        game = new_game(seed)
+        game.level = level
+        game.asteroids = game.create_asteroids(level)
+        return game
+
+    return build
+
+
+def live_bullets(count):
+    """Level 10 with ``count`` bullets fanned out from the ship."""
+
+    def build(seed):
+        game = at_level(10)(seed)
+        pool = BulletPool(capacity=count)
+        for index in range(count):
+            angle = 2 * math.pi * index / count
+            distance = 30 + (index % 50) * 10
+            position = (
+                640 + distance * math.cos(angle),
+                400 + distance * math.sin(angle),
+            )
+            pool.spawn(position, (10 * math.cos(angle), 10 * math.sin(angle)))
+        game.player.bullets = pool
+        return game
+
+    return build
+
+
+def split_cascade(count):
+    """``count`` large asteroids, each with a bullet sitting on top of it."""
+
+    def build(seed):
+        game = new_game(seed)
+        rng = random.Random(seed)
+        field = AsteroidField(rng=game.rng)
+        pool = BulletPool(capacity=count)
+        for _ in range(count):
+            position = (rng.uniform(0, 1280), rng.uniform(0, 800))
+            velocity = (rng.uniform(-2, 2), rng.uniform(-2, 2))
+            field.append(
+                Asteroid(position, ASTEROID_SIZES["LG"], (255, 0, 0), velocity)
+            )
+            pool.spawn(position, (0, 0))
+        game.asteroids = field
+        game.player.bullets = pool
+        # Keep the ship out of the way so only the bullets hit anything.
+        game.player.position.update(-1000, -1000)
+        return game
+
+    return build
+
+
+def power_ups(count):
+    """Level 1 with ``count`` power-ups scattered over the playfield."""
+
+    def build(seed):
+        game = at_level(1)(seed)
+        # A budget big enough for all of them, and none expire mid-run.
+        game.power_ups = PowerUpSpawner(
+            game.rng, game.world_size, game.tick_rate, lifetime=3600, max_live=count
+        )
+        for _ in range(count):
+            game.power_ups.spawn(game.ticks)
+        return game
+
+    return build
+
+
+def particles(count):
+    """Level 1 with ``count`` live explosion particles."""
+
+    def build(seed):
+        game = at_level(1)(seed)
+        # Headless games don't keep particles, so swap a real system in.
+        game.particles = ParticleSystem(capacity=count, seed=seed)
+        # Long-lived so none expire while a scenario is timed.
+        for _ in range(count // 50):
+            game.particles.explode(
+                game.random_position(), 50, (255, 0, 0), life=(6000, 9000)
+            )
+        return game
+
+    return build
+
+
+# name -> (builder, whether each timed call needs a freshly built state)
+SCENARIOS = {
+    "level_1": (at_level(1), False),
+    "level_10": (at_level(10), False),
+    "level_50": (at_level(50), False),
+    "bullets_500": (live_bullets(500), False),
+    "split_cascade_200": (split_cascade(200), True),
+    "power_ups_200": (power_ups(200), False),
+    "particles_4000": (particles(4000), False),
+}
+
+# Game hot paths timed for every scenario.
+TARGETS = ("update", "check_collisions", "check_power_up_collection", "draw")
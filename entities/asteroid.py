@@ -1,90 +1,130 @@
 """Asteroid class for a space game."""
 
 import random
+from collections import namedtuple
 
 import pygame
 
+from utils.sprites import circle_sprite
+from utils.world import WORLD_SIZE
+
 ASTEROID_SIZES = {"XS": 20, "SM": 40, "MD": 60, "LG": 80}
 
+# Size an asteroid breaks into when it is hit.
+SPLIT_SIZES = {
+    ASTEROID_SIZES["SM"]: ASTEROID_SIZES["XS"],
+    ASTEROID_SIZES["MD"]: ASTEROID_SIZES["SM"],
+    ASTEROID_SIZES["LG"]: ASTEROID_SIZES["MD"],
+}
+
+# Everything that differs between asteroid kinds, shared by every asteroid
+# of that kind. ``speed`` scales the velocity an asteroid is spawned with.
+AsteroidKind = namedtuple("AsteroidKind", "name color speed zigzag")
+
+KIND_NORMAL = 0
+KIND_FAST = 1
+KIND_ZIGZAG = 2
+ASTEROID_KINDS = (
+    AsteroidKind("normal", (255, 0, 0), speed=1, zigzag=False),
+    AsteroidKind("fast", (0, 255, 0), speed=2, zigzag=False),
+    AsteroidKind("zigzag", (0, 0, 255), speed=1, zigzag=True),
+)
+KIND_NAMES = tuple(kind.name for kind in ASTEROID_KINDS)
 
-class Asteroid:
-    """Asteroid class for a space game."""
 
-    def __init__(self, position, size, color, velocity):
+class Asteroid:
+    """Asteroid class for a space game.
+
+    Instances hold only their own state; behavior comes from the kind
+    table and the image and mask from the shared sprite cache. Fragments
+    keep their parent's color, so color stays per asteroid.
+    """
+
+    __slots__ = (
+        "position",
+        "velocity",
+        "size",
+        "color",
+        "kind",
+        "zigzag_direction",
+        "bounds",
+    )
+
+    collision_shape = "circle"
+
+    def __init__(
+        self, position, size, color, velocity, bounds=WORLD_SIZE, kind=KIND_NORMAL
+    ):
         self.position = pygame.Vector2(position)
+        self.velocity = pygame.Vector2(velocity)
         self.size = size
         self.color = color
-        self.velocity = velocity
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (size // 2, size // 2), size // 2)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.explosion_sound = pygame.mixer.Sound("assets/sounds/explosion.mp3")
+        self.kind = kind
+        self.zigzag_direction = 1
+        self.bounds = bounds  # (width, height) of the playfield
+
+    @property
+    def image(self):
+        return circle_sprite(self.size, self.color)[0]
+
+    @property
+    def mask(self):
+        return circle_sprite(self.size, self.color)[1]
 
     def draw(self, screen):
-        """Draw the asteroid on the screen."""
-        screen.blit(
+        """Draw the asteroid on the screen and return the rect it covers."""
+        return screen.blit(
             self.image, self.position - pygame.Vector2(self.size / 2, self.size / 2)
         )
 
     def update(self):
         """Update the asteroid's position based on its velocity."""
         self.position += self.velocity
-        if self.position.x < 0 or self.position.x > 1280:
+        if ASTEROID_KINDS[self.kind].zigzag:
+            self.velocity.x += self.zigzag_direction * 0.1
+            if abs(self.velocity.x) > 2:
+                self.zigzag_direction *= -1
+        width, height = self.bounds
+        if self.position.x < 0 or self.position.x > width:
             self.velocity.x = -self.velocity.x
-        if self.position.y < 0 or self.position.y > 800:
+        if self.position.y < 0 or self.position.y > height:
             self.velocity.y = -self.velocity.y
 
     def get_collision_radius(self):
         """Get the collision radius of the asteroid."""
         return self.size / 2
 
-    def split(self):
-        
-        self.explosion_sound.play()
-        
+    def split(self, rng=random):
         """Split the asteroid into smaller ones."""
-        if self.size == ASTEROID_SIZES["XS"]:
-            return []
-        if self.size == ASTEROID_SIZES["SM"]:
-            new_size = ASTEROID_SIZES["XS"]
-        elif self.size == ASTEROID_SIZES["MD"]:
-            new_size = ASTEROID_SIZES["SM"]
-        elif self.size == ASTEROID_SIZES["LG"]:
-            new_size = ASTEROID_SIZES["MD"]
-        else:
+        new_size = SPLIT_SIZES.get(self.size)
+        if new_size is None:
             return []
 
-        new_velocity1 = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, 2))
-        new_velocity2 = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, 2))
+        new_velocity1 = pygame.Vector2(rng.uniform(-2, 2), rng.uniform(-2, 2))
+        new_velocity2 = pygame.Vector2(rng.uniform(-2, 2), rng.uniform(-2, 2))
 
         return [
-            Asteroid(self.position, new_size, self.color, new_velocity1),
-            Asteroid(self.position, new_size, self.color, new_velocity2),
+            Asteroid(self.position, new_size, self.color, new_velocity1, self.bounds),
+            Asteroid(self.position, new_size, self.color, new_velocity2, self.bounds),
         ]
 
 
 class FastAsteroid(Asteroid):
     """FastAsteroid class for a space game."""
 
-    def __init__(self, position, size, color, velocity):
-        super().__init__(position, size, color, velocity)
-        self.velocity *= 2  # Double the speed
+    __slots__ = ()
+
+    def __init__(self, position, size, color, velocity, bounds=WORLD_SIZE):
+        speed = ASTEROID_KINDS[KIND_FAST].speed
+        super().__init__(
+            position, size, color, pygame.Vector2(velocity) * speed, bounds, KIND_FAST
+        )
 
 
 class ZigzagAsteroid(Asteroid):
     """ZigzagAsteroid class for a space game."""
 
-    def __init__(self, position, size, color, velocity):
-        super().__init__(position, size, color, velocity)
-        self.zigzag_direction = 1
+    __slots__ = ()
 
-    def update(self):
-        """Update the asteroid's position with zigzag movement."""
-        self.position += self.velocity
-        self.velocity.x += self.zigzag_direction * 0.1
-        if abs(self.velocity.x) > 2:
-            self.zigzag_direction *= -1
-        if self.position.x < 0 or self.position.x > 1280:
-            self.velocity.x = -self.velocity.x
-        if self.position.y < 0 or self.position.y > 800:
-            self.velocity.y = -self.velocity.y
+    def __init__(self, position, size, color, velocity, bounds=WORLD_SIZE):
+        super().__init__(position, size, color, velocity, bounds, KIND_ZIGZAG)
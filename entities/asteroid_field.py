@@ -0,0 +1,272 @@
+"""Structure-of-arrays storage for every asteroid in play."""
+
+import random
+
+import numpy as np
+import pygame
+
+from utils.sprites import circle_sprite
+from utils.world import WORLD_SIZE
+
+from .asteroid import ASTEROID_KINDS, KIND_NORMAL, SPLIT_SIZES, Asteroid
+
+# Kind table columns the vectorized update indexes by row kind.
+_ZIGZAG = np.array([kind.zigzag for kind in ASTEROID_KINDS])
+
+
+class AsteroidField:
+    """Asteroid positions, velocities and traits kept in NumPy arrays.
+
+    Rows ``0..len(field) - 1`` are live. Iterating or indexing the field
+    yields ``AsteroidView`` objects that read straight from the arrays; a
+    view is only valid until the next ``remove`` compacts the rows.
+    """
+
+    def __init__(self, asteroids=(), capacity=64, rng=random, bounds=WORLD_SIZE):
+        self.count = 0
+        self.rng = rng  # Source of fragment velocities
+        self.bounds = bounds  # (width, height) asteroids bounce inside
+        self.positions = np.zeros((capacity, 2))
+        # Positions before the last update, for interpolated drawing.
+        self.previous_positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.sizes = np.zeros(capacity, dtype=np.int32)
+        self.colors = np.zeros((capacity, 3), dtype=np.uint8)
+        self.kinds = np.zeros(capacity, dtype=np.int8)
+        self.zigzag_directions = np.ones(capacity)
+        self.extend(asteroids)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield AsteroidView(self, index)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("asteroid index out of range")
+        return AsteroidView(self, index)
+
+    def add(
+        self, position, size, color, velocity, kind=KIND_NORMAL, zigzag_direction=1
+    ):
+        """Append one asteroid row and return its index."""
+        if self.count == len(self.sizes):
+            self._grow(max(1, self.count * 2))
+        index = self.count
+        self.positions[index] = position
+        self.previous_positions[index] = position
+        self.velocities[index] = velocity
+        self.sizes[index] = size
+        self.colors[index] = color
+        self.kinds[index] = kind
+        self.zigzag_directions[index] = zigzag_direction
+        self.count += 1
+        return index
+
+    def append(self, asteroid):
+        """Append an Asteroid (or subclass) object as a new row."""
+        return self.add(
+            asteroid.position,
+            asteroid.size,
+            asteroid.color,
+            asteroid.velocity,
+            asteroid.kind,
+            asteroid.zigzag_direction,
+        )
+
+    def extend(self, asteroids):
+        """Append every asteroid in an iterable."""
+        for asteroid in asteroids:
+            self.append(asteroid)
+
+    def remove(self, indices):
+        """Drop the given rows and compact the survivors in order."""
+        if len(indices) == 0:
+            return
+        count = self.count
+        keep = np.ones(count, dtype=bool)
+        keep[list(indices)] = False
+        remaining = int(keep.sum())
+        for array in self._arrays():
+            array[:remaining] = array[:count][keep]
+        self.count = remaining
+
+    def update(self, dt=1.0):
+        """Move every asteroid one step, including zigzag and edge bounce.
+
+        ``dt`` is the step length in 60 Hz frames, the unit velocities use.
+        """
+        count = self.count
+        positions = self.positions[:count]
+        velocities = self.velocities[:count]
+        self.previous_positions[:count] = positions
+        positions += velocities * dt
+
+        zigzag = _ZIGZAG[self.kinds[:count]]
+        if zigzag.any():
+            directions = self.zigzag_directions[:count]
+            velocities[zigzag, 0] += directions[zigzag] * (0.1 * dt)
+            directions[zigzag & (np.abs(velocities[:, 0]) > 2)] *= -1
+
+        width, height = self.bounds
+        x = positions[:, 0]
+        y = positions[:, 1]
+        velocities[(x < 0) | (x > width), 0] *= -1
+        velocities[(y < 0) | (y > height), 1] *= -1
+
+    def split(self, indices):
+        """Append the fragments of each hit row."""
+        for index in indices:
+            new_size = SPLIT_SIZES.get(int(self.sizes[index]))
+            if new_size is None:
+                continue
+            position = self.positions[index].copy()
+            color = self.colors[index].copy()
+            for _ in range(2):
+                velocity = (self.rng.uniform(-2, 2), self.rng.uniform(-2, 2))
+                self.add(position, new_size, color, velocity)
+
+    def near(self, position, radius):
+        """Return indices of asteroids whose circle reaches within radius."""
+        count = self.count
+        delta = self.positions[:count] - (position[0], position[1])
+        reach = self.sizes[:count] / 2 + radius
+        return np.flatnonzero((delta * delta).sum(axis=1) <= reach * reach)
+
+    def draw(self, screen, alpha=1.0):
+        """Draw every asteroid with one batched blit; return their rects.
+
+        ``alpha`` blends between the previous and current positions.
+        """
+        count = self.count
+        sizes = self.sizes[:count].tolist()
+        colors = self.colors[:count].tolist()
+        positions = _interpolated(
+            self.previous_positions[:count], self.positions[:count], alpha
+        )
+        corners = (positions - self.sizes[:count, None] / 2).tolist()
+        return screen.blits(
+            [
+                (circle_sprite(size, tuple(color))[0], corner)
+                for size, color, corner in zip(sizes, colors, corners)
+            ]
+        )
+
+    def to_asteroids(self):
+        """Return standalone Asteroid objects for every live row."""
+        return [view.to_asteroid() for view in self]
+
+    def state_arrays(self):
+        """Return the per-row arrays that make up the simulation state."""
+        return (
+            self.positions,
+            self.velocities,
+            self.sizes,
+            self.colors,
+            self.kinds,
+            self.zigzag_directions,
+        )
+
+    def _arrays(self):
+        return (
+            self.positions,
+            self.previous_positions,
+            self.velocities,
+            self.sizes,
+            self.colors,
+            self.kinds,
+            self.zigzag_directions,
+        )
+
+    def _grow(self, capacity):
+        self.positions = _resized(self.positions, capacity)
+        self.previous_positions = _resized(self.previous_positions, capacity)
+        self.velocities = _resized(self.velocities, capacity)
+        self.sizes = _resized(self.sizes, capacity)
+        self.colors = _resized(self.colors, capacity)
+        self.kinds = _resized(self.kinds, capacity)
+        self.zigzag_directions = _resized(self.zigzag_directions, capacity, fill=1)
+
+
+class AsteroidView:
+    """Lightweight handle on one row of an AsteroidField."""
+
+    __slots__ = ("field", "index")
+
+    collision_shape = "circle"
+
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+
+    @property
+    def position(self):
+        return pygame.Vector2(self.field.positions[self.index].tolist())
+
+    @property
+    def velocity(self):
+        return pygame.Vector2(self.field.velocities[self.index].tolist())
+
+    @property
+    def size(self):
+        return int(self.field.sizes[self.index])
+
+    @property
+    def color(self):
+        return tuple(self.field.colors[self.index].tolist())
+
+    @property
+    def kind(self):
+        return int(self.field.kinds[self.index])
+
+    @property
+    def image(self):
+        return circle_sprite(self.size, self.color)[0]
+
+    @property
+    def mask(self):
+        return circle_sprite(self.size, self.color)[1]
+
+    def draw(self, screen):
+        """Draw the asteroid on the screen and return the rect it covers."""
+        size = self.size
+        return screen.blit(
+            self.image, self.position - pygame.Vector2(size / 2, size / 2)
+        )
+
+    def get_collision_radius(self):
+        """Get the collision radius of the asteroid."""
+        return self.field.sizes[self.index] / 2
+
+    def split(self, rng=None):
+        """Return the fragments this asteroid would break into."""
+        return self.to_asteroid().split(self.field.rng if rng is None else rng)
+
+    def to_asteroid(self):
+        """Build a standalone Asteroid object from this row."""
+        asteroid = Asteroid(
+            self.position,
+            self.size,
+            self.color,
+            self.velocity,
+            self.field.bounds,
+            self.kind,
+        )
+        asteroid.zigzag_direction = int(self.field.zigzag_directions[self.index])
+        return asteroid
+
+
+def _interpolated(previous, current, alpha):
+    if alpha >= 1.0:
+        return current
+    return previous + (current - previous) * alpha
+
+
+def _resized(array, capacity, fill=0):
+    grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
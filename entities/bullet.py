@@ -1,28 +1,179 @@
 """Bullet class for a simple 2D game."""
 
+import numpy as np
 import pygame
 
+from utils.sprites import circle_sprite
+from utils.world import WORLD_SIZE
+
 
 class Bullet:
     """Bullet class for a simple 2D game."""
 
+    __slots__ = ("position", "velocity", "color", "size")
+
+    collision_shape = "circle"
+
     def __init__(self, position, velocity, color, size=5):
         self.position = pygame.Vector2(position)
         self.velocity = pygame.Vector2(velocity)
         self.color = color
         self.size = size
-        self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (size, size), size)
-        self.mask = pygame.mask.from_surface(self.image)
+
+    @property
+    def image(self):
+        return circle_sprite(self.size * 2, self.color)[0]
+
+    @property
+    def mask(self):
+        return circle_sprite(self.size * 2, self.color)[1]
 
     def update(self):
         """Update the bullet's position based on its velocity."""
         self.position += self.velocity
 
     def draw(self, screen):
-        """Draw the bullet on the screen."""
-        screen.blit(self.image, self.position - pygame.Vector2(self.size, self.size))
+        """Draw the bullet on the screen and return the rect it covers."""
+        return screen.blit(
+            self.image, self.position - pygame.Vector2(self.size, self.size)
+        )
 
     def get_collision_radius(self):
         """Get the collision radius of the bullet."""
         return self.size
+
+
+class BulletPool:
+    """Fixed-capacity bullet storage backed by flat NumPy arrays.
+
+    Slots ``0..len(pool) - 1`` are live. Spent slots are reused by
+    compacting survivors to the front, so firing and culling never
+    allocate new bullets.
+    """
+
+    def __init__(
+        self, capacity=256, color=(255, 255, 255), size=5, bounds=WORLD_SIZE
+    ):
+        self.capacity = capacity
+        self.bounds = bounds  # Bullets leaving (width, height) are culled
+        self.count = 0
+        self.positions = np.zeros((capacity, 2))
+        self.previous_positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.color = color
+        self.size = size
+        self.image, self.mask = circle_sprite(size * 2, color)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield BulletView(self, index)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("bullet index out of range")
+        return BulletView(self, index)
+
+    def spawn(self, position, velocity):
+        """Claim a free slot for a new bullet; return False when full."""
+        if self.count == self.capacity:
+            return False
+        self.positions[self.count] = position
+        self.previous_positions[self.count] = position
+        self.velocities[self.count] = velocity
+        self.count += 1
+        return True
+
+    def update(self, dt=1.0):
+        """Move every bullet and drop the ones that left the playfield."""
+        count = self.count
+        positions = self.positions[:count]
+        self.previous_positions[:count] = positions
+        positions += self.velocities[:count] * dt
+        x = positions[:, 0]
+        y = positions[:, 1]
+        width, height = self.bounds
+        on_screen = (x >= 0) & (x <= width) & (y >= 0) & (y <= height)
+        self._compact(on_screen)
+
+    def remove(self, indices):
+        """Free the given slots, keeping the survivors in order."""
+        if len(indices) == 0:
+            return
+        keep = np.ones(self.count, dtype=bool)
+        keep[list(indices)] = False
+        self._compact(keep)
+
+    def clear(self):
+        """Free every slot."""
+        self.count = 0
+
+    def draw(self, screen, alpha=1.0):
+        """Draw every live bullet with one batched blit; return their rects."""
+        image = self.image
+        positions = self.positions[: self.count]
+        if alpha < 1.0:
+            previous = self.previous_positions[: self.count]
+            positions = previous + (positions - previous) * alpha
+        corners = (positions - self.size).tolist()
+        return screen.blits([(image, corner) for corner in corners])
+
+    def _compact(self, keep):
+        remaining = int(keep.sum())
+        if remaining == self.count:
+            return
+        count = self.count
+        self.positions[:remaining] = self.positions[:count][keep]
+        self.previous_positions[:remaining] = self.previous_positions[:count][keep]
+        self.velocities[:remaining] = self.velocities[:count][keep]
+        self.count = remaining
+
+
+class BulletView:
+    """Lightweight handle on one slot of a BulletPool."""
+
+    __slots__ = ("pool", "index")
+
+    collision_shape = "circle"
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    @property
+    def position(self):
+        return pygame.Vector2(self.pool.positions[self.index].tolist())
+
+    @property
+    def velocity(self):
+        return pygame.Vector2(self.pool.velocities[self.index].tolist())
+
+    @property
+    def size(self):
+        return self.pool.size
+
+    @property
+    def color(self):
+        return self.pool.color
+
+    @property
+    def image(self):
+        return self.pool.image
+
+    @property
+    def mask(self):
+        return self.pool.mask
+
+    def draw(self, screen):
+        """Draw the bullet on the screen and return the rect it covers."""
+        return screen.blit(
+            self.image, self.position - pygame.Vector2(self.size, self.size)
+        )
+
+    def get_collision_radius(self):
+        """Get the collision radius of the bullet."""
+        return self.pool.size
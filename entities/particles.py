@@ -0,0 +1,161 @@
+"""Vectorized particle effects for explosions and engine exhaust."""
+
+import math
+
+import numpy as np
+
+from utils.sprites import circle_sprite
+
+# Sprite diameter by how much life a particle has left, dimmest first.
+FADE_SIZES = (2, 3, 4, 6)
+
+
+class NullParticles:
+    """Particle system that keeps nothing, for headless runs."""
+
+    def __len__(self):
+        return 0
+
+    def explode(self, position, count, color, speed=3.0, life=(20, 40)):
+        pass
+
+    def exhaust(self, position, direction, base_velocity, **options):
+        pass
+
+    def update(self, dt=1.0):
+        pass
+
+    def draw(self, screen):
+        return []
+
+    def clear(self):
+        pass
+
+
+class ParticleSystem:
+    """Short-lived particles in fixed-size NumPy buffers.
+
+    Rows ``0..len(system) - 1`` are live. Integration, drag and expiry are
+    whole-array operations, and drawing is one ``blits`` call over sprites
+    picked from a small cache (one per palette color and fade step). When
+    the buffer is full new particles are dropped rather than allocated.
+    """
+
+    def __init__(self, capacity=4096, drag=0.96, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity)  # Frames left
+        self.max_life = np.ones(capacity)
+        self.colors = np.zeros(capacity, dtype=np.int32)  # Index into palette
+        self.drag = drag
+        self.rng = np.random.default_rng(seed)
+        self.palette = {}  # RGB tuple -> palette index
+        # Sprite for palette index i at fade step s is at i * steps + s.
+        self.sprites = []
+        self.half_sizes = np.array(FADE_SIZES) / 2
+        self.dropped = 0
+
+    def __len__(self):
+        return self.count
+
+    def explode(self, position, count, color, speed=3.0, life=(20, 40)):
+        """Burst ``count`` particles outwards from position."""
+        rng = self.rng
+        angles = rng.uniform(0, 2 * math.pi, count)
+        speeds = rng.uniform(0.2, 1.0, count) * speed
+        velocities = np.column_stack((np.cos(angles), np.sin(angles))) * speeds[:, None]
+        self.emit(position, velocities, rng.uniform(*life, count), color)
+
+    def exhaust(
+        self,
+        position,
+        direction,
+        base_velocity,
+        count=3,
+        speed=3.0,
+        spread=0.35,
+        color=(255, 165, 0),
+        life=(8, 16),
+    ):
+        """Puff particles backwards from position, opposite direction."""
+        rng = self.rng
+        angles = math.atan2(-direction[1], -direction[0]) + rng.uniform(
+            -spread, spread, count
+        )
+        speeds = rng.uniform(0.5, 1.0, count) * speed
+        velocities = np.column_stack((np.cos(angles), np.sin(angles))) * speeds[:, None]
+        velocities += (base_velocity[0], base_velocity[1])
+        self.emit(position, velocities, rng.uniform(*life, count), color)
+
+    def emit(self, positions, velocities, life, color):
+        """Append particles; positions may be one point shared by all."""
+        count = min(len(velocities), self.capacity - self.count)
+        self.dropped += len(velocities) - count
+        if count <= 0:
+            return
+        start = self.count
+        stop = start + count
+        positions = np.broadcast_to(positions, velocities.shape)
+        self.positions[start:stop] = positions[:count]
+        self.velocities[start:stop] = velocities[:count]
+        self.life[start:stop] = life[:count]
+        self.max_life[start:stop] = life[:count]
+        self.colors[start:stop] = self._color_index(color)
+        self.count = stop
+
+    def update(self, dt=1.0):
+        """Move, slow and age every particle, dropping the expired ones."""
+        count = self.count
+        if count == 0:
+            return
+        velocities = self.velocities[:count]
+        self.positions[:count] += velocities * dt
+        velocities *= self.drag**dt
+        life = self.life[:count]
+        life -= dt
+        alive = life > 0
+        if alive.all():
+            return
+        remaining = int(alive.sum())
+        for array in (
+            self.positions,
+            self.velocities,
+            self.life,
+            self.max_life,
+            self.colors,
+        ):
+            array[:remaining] = array[:count][alive]
+        self.count = remaining
+
+    def draw(self, screen):
+        """Draw every particle with one batched blit; return their rects."""
+        count = self.count
+        if count == 0:
+            return []
+        steps = len(FADE_SIZES)
+        fade = (self.life[:count] / self.max_life[:count] * steps).astype(np.int32)
+        np.minimum(fade, steps - 1, out=fade)
+        corners = self.positions[:count] - self.half_sizes[fade][:, None]
+        sprites = self.sprites
+        return screen.blits(
+            [
+                (sprites[index], corner)
+                for index, corner in zip(
+                    (self.colors[:count] * steps + fade).tolist(), corners.tolist()
+                )
+            ]
+        )
+
+    def clear(self):
+        """Remove every particle."""
+        self.count = 0
+
+    def _color_index(self, color):
+        color = tuple(color)
+        index = self.palette.get(color)
+        if index is None:
+            index = self.palette[color] = len(self.palette)
+            self.sprites.extend(circle_sprite(size, color)[0] for size in FADE_SIZES)
+        return index
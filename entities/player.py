@@ -4,38 +4,66 @@ import math
 
 import pygame
 
-from .bullet import Bullet
+from utils.sprites import sprite_cache
+from utils.world import WORLD_SIZE
+
+from .bullet import BulletPool
+
+# Angle resolution of the pre-rotated ship sprites, in degrees.
+ROTATION_STEP = 5
+
+
+def _flame_directions(angle):
+    """Unit vectors used to place the thrust flame at a given ship angle."""
+    return tuple(
+        (math.cos(math.radians(angle + turn)), math.sin(math.radians(angle + turn)))
+        for turn in (-90, -120, 120)
+    )
+
+
+# One entry per atlas frame, so drawing the flame needs no trig calls.
+FLAME_DIRECTIONS = [
+    _flame_directions(index * ROTATION_STEP) for index in range(360 // ROTATION_STEP)
+]
 
 
 class Player:
     """Player class for a 2D game."""
 
-    def __init__(self, position, size, color):
+    # The ship is a triangle, so precise tests go through its mask.
+    collision_shape = "mask"
+
+    def __init__(
+        self, position, size, color, bullet_capacity=256, bounds=WORLD_SIZE
+    ):
         self.position = pygame.Vector2(position)
+        self.bounds = bounds  # (width, height) the ship wraps around
+        self.previous_position = pygame.Vector2(position)
         self.size = size
         self.color = color
         self.velocity = pygame.Vector2(0, 0)
         self.angle = 0
+        self.thrusting = False
         self.thrust = 0.1
         self.rotation_speed = 5
         self.slowdown = 0.98
-        self.bullets = []
+        self.bullets = BulletPool(bullet_capacity, bounds=bounds)
         self.lives = 3  # Initialize player lives
         self.image = pygame.Surface((size, size), pygame.SRCALPHA)
         self.update_image()
-        self.mask = pygame.mask.from_surface(self.image)
         # Invulnerability period (milliseconds) and last hit time
         self.invulnerability_duration = 2000
         self.last_hit_time = 0
-        self.shoot_sound = pygame.mixer.Sound("assets/sounds/laser.mp3")
-        self.thrust_sound = pygame.mixer.Sound("assets/sounds/engine.mp3")
-        # self.thrust_sound.set_volume(0.5)
-
-    def is_invulnerable(self):
-        """Check if the player is currently invulnerable."""
-        return (
-            pygame.time.get_ticks() - self.last_hit_time < self.invulnerability_duration
-        )
+
+    def is_invulnerable(self, now=None):
+        """Check if the player is currently invulnerable.
+
+        ``now`` is the current time in milliseconds; it defaults to the
+        pygame clock, but simulations pass their own simulated time.
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+        return now - self.last_hit_time < self.invulnerability_duration
 
     def get_points(self):
         """Calculate the points of the player's triangle shape."""
@@ -48,87 +76,114 @@ class Player:
         ]
 
     def update_image(self):
-        """Update the player's image based on its current angle."""
+        """Redraw the ship and fetch its pre-rotated atlas."""
         self.image.fill((0, 0, 0, 0))
         pygame.draw.polygon(self.image, self.color, self.get_points())
-        self.mask = pygame.mask.from_surface(self.image)
+        self.atlas = sprite_cache.rotations(
+            ("ship", self.size, tuple(self.color)), self.image, ROTATION_STEP
+        )
+
+    @property
+    def mask(self):
+        """Collision mask of the ship rotated to its current angle."""
+        return self.atlas.frame(self.angle)[1]
 
-    def draw_thrust(self, screen):
+    def draw_thrust(self, screen, position=None):
         """Draw the thrust animation behind the player."""
-        if pygame.key.get_pressed()[pygame.K_UP]:  # Check if thrust is applied
-            rad_angle = math.radians(self.angle - 90)
-            flame_offset = pygame.Vector2(
-                -(self.size / 2) * math.cos(rad_angle), -(self.size / 2) * math.sin(rad_angle)
-            )
-            flame_position = self.position + flame_offset
+        if position is None:
+            position = self.position
+        if self.thrusting:  # Check if thrust is applied
+            back, left, right = FLAME_DIRECTIONS[self.atlas.index(self.angle)]
+            half_size = self.size / 2
+            flame_x = position.x - half_size * back[0]
+            flame_y = position.y - half_size * back[1]
             flame_points = [
-                (flame_position.x, flame_position.y),
-                (flame_position.x - 8 * math.cos(math.radians(self.angle - 120)),
-                flame_position.y - 8 * math.sin(math.radians(self.angle - 120))),
-                (flame_position.x - 8 * math.cos(math.radians(self.angle + 120)),
-                flame_position.y - 8 * math.sin(math.radians(self.angle + 120))),
+                (flame_x, flame_y),
+                (flame_x - 8 * left[0], flame_y - 8 * left[1]),
+                (flame_x - 8 * right[0], flame_y - 8 * right[1]),
             ]
-            pygame.draw.polygon(screen, (255, 165, 0), flame_points)  # Orange flame
+            # Orange flame
+            return pygame.draw.polygon(screen, (255, 165, 0), flame_points)
+        return None
+
+    def exhaust(self):
+        """Return the rear point of the ship and its unit facing direction."""
+        forward = FLAME_DIRECTIONS[self.atlas.index(self.angle)][0]
+        half_size = self.size / 2
+        rear = (
+            self.position.x - half_size * forward[0],
+            self.position.y - half_size * forward[1],
+        )
+        return rear, forward
 
-    def draw(self, screen):
-        """Draw the player on the screen."""
-        rotated_image = pygame.transform.rotate(self.image, -self.angle)
-        new_rect = rotated_image.get_rect(center=(self.position.x, self.position.y))
-        screen.blit(rotated_image, new_rect.topleft)
+    def draw(self, screen, alpha=1.0):
+        """Draw the player on the screen and return the rects it covers."""
+        position = self.interpolated_position(alpha)
+        rotated_image = self.atlas.frame(self.angle)[0]
+        new_rect = rotated_image.get_rect(center=(position.x, position.y))
+        rects = [screen.blit(rotated_image, new_rect.topleft)]
 
         # Draw thrust animation
-        self.draw_thrust(screen)
-
-        for bullet in self.bullets:
-            bullet.draw(screen)
-
-    def update(self):
-        """Update the player's position and handle input."""
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.angle -= self.rotation_speed
-        if keys[pygame.K_RIGHT]:
-            self.angle += self.rotation_speed
-        if keys[pygame.K_UP]:
-            self.apply_thrust()
-        else:
-            if self.thrust_sound.get_num_channels() > 0:
-                self.thrust_sound.stop()
-        if keys[pygame.K_DOWN]:
-            self.apply_slowdown()
-
-        self.position += self.velocity
+        flame_rect = self.draw_thrust(screen, position)
+        if flame_rect is not None:
+            rects.append(flame_rect)
+
+        rects.extend(self.bullets.draw(screen, alpha))
+        return rects
+
+    def interpolated_position(self, alpha):
+        """Blend the previous and current positions for drawing."""
+        if alpha >= 1.0:
+            return self.position
+        previous = self.previous_position
+        # Don't smear the ship across the screen after wrapping around.
+        jump = self.position - previous
+        width, height = self.bounds
+        if abs(jump.x) > width / 2 or abs(jump.y) > height / 2:
+            return self.position
+        return previous.lerp(self.position, alpha)
+
+    def update(self, controls, dt=1.0):
+        """Update the player's position from this tick's controls.
+
+        ``dt`` is the step length in 60 Hz frames, the unit speeds use.
+        """
+        self.previous_position = pygame.Vector2(self.position)
+        if controls.left:
+            self.angle -= self.rotation_speed * dt
+        if controls.right:
+            self.angle += self.rotation_speed * dt
+        self.thrusting = controls.thrust
+        if controls.thrust:
+            self.apply_thrust(dt)
+        if controls.brake:
+            self.apply_slowdown(dt)
+
+        self.position += self.velocity * dt
         self.wrap_around_screen()
 
-        for bullet in self.bullets:
-            bullet.update()
+        self.bullets.update(dt)
 
-        self.bullets = [
-            bullet for bullet in self.bullets if self.is_bullet_on_screen(bullet)
-        ]
-
-    def apply_thrust(self):
+    def apply_thrust(self, dt=1.0):
         """Apply thrust to the player."""
         rad_angle = math.radians(self.angle - 90)
-        self.velocity.x += self.thrust * math.cos(rad_angle)
-        self.velocity.y += self.thrust * math.sin(rad_angle)
+        self.velocity.x += self.thrust * dt * math.cos(rad_angle)
+        self.velocity.y += self.thrust * dt * math.sin(rad_angle)
 
-        if self.thrust_sound.get_num_channels() == 0:  # Check if thrust sound is playing
-            self.thrust_sound.play(-1)  # Loop the sound
-                
-    def apply_slowdown(self):
+    def apply_slowdown(self, dt=1.0):
         """Apply slowdown to the player."""
-        self.velocity *= self.slowdown
+        self.velocity *= self.slowdown**dt
 
     def wrap_around_screen(self):
         """Wrap the player around the screen edges."""
+        width, height = self.bounds
         if self.position.x < 0:
-            self.position.x = 1280
-        elif self.position.x > 1280:
+            self.position.x = width
+        elif self.position.x > width:
             self.position.x = 0
         if self.position.y < 0:
-            self.position.y = 800
-        elif self.position.y > 800:
+            self.position.y = height
+        elif self.position.y > height:
             self.position.y = 0
 
     def get_collision_radius(self):
@@ -136,7 +191,7 @@ class Player:
         return self.size / 2
 
     def shoot(self):
-        """Shoot a bullet from the player's position."""
+        """Shoot a bullet from the player's position; return whether it fired."""
         rad_angle = math.radians(self.angle - 90)
         bullet_velocity = pygame.Vector2(
             10 * math.cos(rad_angle), 10 * math.sin(rad_angle)
@@ -145,11 +200,5 @@ class Player:
             (self.size / 2) * math.cos(rad_angle), (self.size / 2) * math.sin(rad_angle)
         )
         bullet_position = self.position + bullet_offset
-        self.bullets.append(Bullet(bullet_position, bullet_velocity, (255, 255, 255)))
-
-        # Play the shooting sound
-        self.shoot_sound.play()
-
-    def is_bullet_on_screen(self, bullet):
-        """Check if the bullet is within the screen bounds."""
-        return 0 <= bullet.position.x <= 1280 and 0 <= bullet.position.y <= 800
+        # False when every bullet slot is in flight.
+        return self.bullets.spawn(bullet_position, bullet_velocity)
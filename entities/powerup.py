@@ -1,28 +1,163 @@
 """Power-up class for the game."""
 
+import heapq
+import itertools
+import random
+
 import pygame
 
+from utils.spatial import SpatialHash
+from utils.sprites import circle_sprite
+from utils.world import WORLD_SIZE
+
+
+def _extra_life(player):
+    player.lives += 1
+
+
+def _increased_speed(player):
+    player.thrust *= 1.5
+
+
+def _shield(player):
+    player.shield = True
+    # Add logic to handle shield duration and effect
+
+
+# What collecting each kind of power-up does to the player.
+POWER_UP_EFFECTS = {
+    "extra_life": _extra_life,
+    "increased_speed": _increased_speed,
+    "shield": _shield,
+}
+POWER_UP_TYPES = list(POWER_UP_EFFECTS)
+
 
 class PowerUp:
     """Power-up class for the game."""
 
-    def __init__(self, position, power_type):
+    __slots__ = ("position", "power_type", "expires_at")
+
+    collision_shape = "circle"
+    # Every power-up looks the same.
+    size = 20
+    color = (255, 255, 0)  # Yellow color for power-ups
+
+    def __init__(self, position, power_type, expires_at=None):
         self.position = pygame.Vector2(position)
         self.power_type = power_type
-        self.size = 20
-        self.color = (255, 255, 0)  # Yellow color for power-ups
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(
-            self.image, self.color, (self.size // 2, self.size // 2), self.size // 2
-        )
-        self.mask = pygame.mask.from_surface(self.image)
+        self.expires_at = expires_at  # Tick it despawns on; None never expires
+
+    @property
+    def image(self):
+        return circle_sprite(self.size, self.color)[0]
+
+    @property
+    def mask(self):
+        return circle_sprite(self.size, self.color)[1]
+
+    def apply(self, player):
+        """Give player this power-up's effect."""
+        POWER_UP_EFFECTS[self.power_type](player)
+
+    def get_collision_radius(self):
+        """Get the collision radius of the power-up."""
+        return self.size / 2
 
     def draw(self, screen):
-        """Draw the power-up on the screen."""
-        screen.blit(
+        """Draw the power-up on the screen and return the rect it covers."""
+        return screen.blit(
             self.image, self.position - pygame.Vector2(self.size / 2, self.size / 2)
         )
 
     def update(self):
         """Update the power-up's position."""
         pass  # Power-ups are stationary, so no update logic needed
+
+
+class PowerUpSpawner:
+    """Live power-ups, spawned on a timer and expired after a lifetime.
+
+    A new power-up appears every ``interval`` seconds while fewer than
+    ``max_live`` are on the field, and each one despawns ``lifetime``
+    seconds later if it isn't collected, so long sessions hold a bounded
+    number. Power-ups don't move, so they are indexed in a spatial hash
+    once and collection only looks at the cells around the player.
+    """
+
+    def __init__(
+        self,
+        rng=random,
+        bounds=WORLD_SIZE,
+        tick_rate=60,
+        interval=10.0,
+        lifetime=15.0,
+        max_live=3,
+    ):
+        self.rng = rng
+        self.bounds = bounds
+        self.interval = max(1, round(interval * tick_rate))  # In ticks
+        self.lifetime = max(1, round(lifetime * tick_rate))
+        self.max_live = max_live
+        self.next_spawn = self.interval
+        self.live = []  # Oldest first
+        # (expires_at, order, power_up) for power-ups that expire; entries
+        # whose power-up was already collected are skipped when they pop.
+        self.expiry = []
+        self._order = itertools.count()
+        self.grid = SpatialHash(cell_size=80)
+
+    def __len__(self):
+        return len(self.live)
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def update(self, tick):
+        """Despawn expired power-ups and spawn a new one when it is due."""
+        expiry = self.expiry
+        while expiry and expiry[0][0] <= tick:
+            power_up = heapq.heappop(expiry)[2]
+            if power_up in self.live:
+                self.remove(power_up)
+        if tick >= self.next_spawn:
+            self.next_spawn = tick + self.interval
+            self.spawn(tick)
+
+    def spawn(self, tick):
+        """Place a random power-up; return it, or None when at the limit."""
+        if len(self.live) >= self.max_live:
+            return None
+        width, height = self.bounds
+        rng = self.rng
+        position = (rng.randint(0, width), rng.randint(0, height))
+        power_type = rng.choice(POWER_UP_TYPES)
+        power_up = PowerUp(position, power_type, tick + self.lifetime)
+        self.add(power_up)
+        return power_up
+
+    def add(self, power_up):
+        """Put an existing PowerUp on the field."""
+        self.live.append(power_up)
+        if power_up.expires_at is not None:
+            heapq.heappush(
+                self.expiry, (power_up.expires_at, next(self._order), power_up)
+            )
+        x, y = power_up.position
+        self.grid.insert(power_up, x, y, power_up.get_collision_radius())
+
+    def remove(self, power_up):
+        """Take a collected or expired power-up off the field."""
+        self.live.remove(power_up)
+        x, y = power_up.position
+        self.grid.remove(power_up, x, y, power_up.get_collision_radius())
+
+    def near(self, position, radius):
+        """Return the power-ups in the grid cells around a circle."""
+        return self.grid.query(position[0], position[1], radius)
+
+    def clear(self):
+        """Remove every power-up."""
+        self.live.clear()
+        self.expiry.clear()
+        self.grid.clear()
@@ -0,0 +1,98 @@
+"""Input sources that drive the player each simulation tick."""
+
+import random
+from collections import namedtuple
+
+import pygame
+
+Controls = namedtuple("Controls", ["left", "right", "thrust", "brake", "shoot"])
+
+NO_CONTROLS = Controls(False, False, False, False, False)
+
+
+class InputSource:
+    """Base class for anything that can steer the player."""
+
+    def handle_event(self, event):
+        """React to a pygame event from the window (ignored by default)."""
+
+    def poll(self):
+        """Return the Controls for the next tick."""
+        return NO_CONTROLS
+
+    def record_purchase(self, index):
+        """Note a shop upgrade bought before the next tick (ignored by default)."""
+
+    def take_purchase(self):
+        """Return the upgrade index to apply this tick, if the source has one."""
+        return None
+
+    def close(self):
+        """Release anything the source holds open (nothing by default)."""
+
+
+class KeyboardInput(InputSource):
+    """Reads the arrow keys each tick and fires on space-bar presses."""
+
+    def __init__(self):
+        self.pending_shots = 0
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self.pending_shots += 1
+
+    def poll(self):
+        keys = pygame.key.get_pressed()
+        shoot = self.pending_shots > 0
+        if shoot:
+            self.pending_shots -= 1
+        return Controls(
+            keys[pygame.K_LEFT],
+            keys[pygame.K_RIGHT],
+            keys[pygame.K_UP],
+            keys[pygame.K_DOWN],
+            shoot,
+        )
+
+
+class RandomInput(InputSource):
+    """Presses random keys; holds each choice for a few ticks."""
+
+    def __init__(self, seed=None, hold_ticks=10, shoot_chance=0.1):
+        self.rng = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self.shoot_chance = shoot_chance
+        self.held = NO_CONTROLS
+        self.remaining = 0
+
+    def poll(self):
+        rng = self.rng
+        if self.remaining == 0:
+            self.held = Controls(
+                rng.random() < 0.3,
+                rng.random() < 0.3,
+                rng.random() < 0.5,
+                rng.random() < 0.1,
+                False,
+            )
+            self.remaining = self.hold_ticks
+        self.remaining -= 1
+        return self.held._replace(shoot=rng.random() < self.shoot_chance)
+
+
+class ScriptedInput(InputSource):
+    """Replays a fixed sequence of Controls, optionally looping."""
+
+    def __init__(self, script, loop=False):
+        self.script = list(script)
+        self.loop = loop
+        self.position = 0
+
+    def poll(self):
+        if self.position >= len(self.script):
+            if not self.loop or not self.script:
+                return NO_CONTROLS
+            self.position = 0
+        controls = self.script[self.position]
+        self.position += 1
+        return controls
@@ -1,236 +1,689 @@
 """Asteroids Clone Game"""
 
-import math
+import hashlib
 import random
 import sys
+import time
 
+import numpy as np
 import pygame
 
-from .shop import Shop
-from entities.asteroid import Asteroid, FastAsteroid, ZigzagAsteroid, ASTEROID_SIZES
+from .controls import InputSource, KeyboardInput
+from .profiler import FrameProfiler, NullProfiler
+from .renderer import Renderer
+from .replay import ReplayInput
+from .shop import UPGRADES, Shop
+from entities.asteroid import (
+    ASTEROID_KINDS,
+    ASTEROID_SIZES,
+    KIND_FAST,
+    KIND_NAMES,
+    KIND_NORMAL,
+    KIND_ZIGZAG,
+)
+from entities.asteroid_field import AsteroidField
+from entities.particles import NullParticles, ParticleSystem
 from entities.player import Player
-from entities.powerup import PowerUp
+from entities.powerup import PowerUpSpawner
+from utils.assets import registry
+from utils.audio import AudioManager, NullAudio
+from utils.spatial import SpatialHash, corner_cell_keys
+from utils.text import TextCache
+from utils.world import WORLD_SIZE
 
-POWER_UP_TYPES = ["extra_life", "increased_speed", "shield"]
+# Entity speeds are expressed in pixels per frame at this rate.
+REFERENCE_TICK_RATE = 60
+
+# Level scaling used by create_asteroids; balancing runs override these.
+DIFFICULTY = {
+    "large_base": 3,  # plain asteroids on level 1
+    "large_per_level": 1,  # extra plain asteroids per level
+    "fast_base": 2,
+    "zigzag_base": 2,
+    "special_level_divisor": 2,  # one more fast/zigzag every N levels
+    "speed_per_level": 0.1,  # velocity multiplier is 1 + level * this
+}
+
+# Power-up budget: one spawns every ``interval`` seconds while fewer than
+# ``max_live`` are out, and each despawns after ``lifetime`` seconds.
+POWER_UPS = {"interval": 10.0, "lifetime": 15.0, "max_live": 3}
+
+# Startup phases in the order they happen. "import" is filled in by the
+# launcher; the first frame (or headless tick) is timed from the end of init.
+STARTUP_PHASES = ("import", "init", "first_frame", "first_tick")
 
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((1280, 800), pygame.RESIZABLE)
-        pygame.display.set_caption("Asteroids Clone")
+    def __init__(
+        self,
+        render_mode="full",
+        tick_rate=60,
+        max_fps=60,
+        max_catch_up=5,
+        headless=False,
+        input_source=None,
+        profile=False,
+        trace_path=None,
+        seed=None,
+        difficulty=None,
+        world_size=WORLD_SIZE,
+        startup_report=False,
+    ):
+        started = time.perf_counter()
+        self.headless = headless
+        # Seconds spent in each startup phase; see startup_lines.
+        self.startup = {}
+        self.startup_report = startup_report
+        # Headless games start no pygame subsystem: they draw to a plain
+        # Surface and NullAudio never asks for a sound. Windowed games start
+        # only the mixer and display (fonts start with the first text drawn),
+        # not everything pygame.init() does.
+        if not headless:
+            self.init_audio()
+            # Decode sounds while the window is created; the first sound
+            # played waits for its file instead of decoding its own copy.
+            registry.preload(background=True)
+            pygame.display.init()
+        # The simulation and all drawing use the logical world size; the
+        # renderer scales frames to the window when the two differ.
+        self.world_size = tuple(world_size)
+        self.renderer = Renderer(render_mode, to_display=not headless)
+        if headless:
+            self.screen = pygame.Surface(self.world_size)
+        else:
+            window = pygame.display.set_mode(self.world_size, pygame.RESIZABLE)
+            pygame.display.set_caption("Asteroids Clone")
+            self.screen = self.renderer.set_window(window, self.world_size)
+        # Visual effects only; headless runs skip them entirely.
+        self.particles = NullParticles() if headless else ParticleSystem()
+        # Sounds go through the voice manager; without a mixer nothing plays.
+        if headless or pygame.mixer.get_init() is None:
+            self.audio = NullAudio()
+        else:
+            self.audio = AudioManager()
+        if input_source is None:
+            # Without a display there are no keys to read.
+            input_source = InputSource() if headless else KeyboardInput()
+        self.input = input_source
         self.clock = pygame.time.Clock()
+        self.text = TextCache()
+        # Fixed simulation step, independent of how often frames are drawn.
+        self.tick_rate = tick_rate
+        self.dt = REFERENCE_TICK_RATE / tick_rate
+        self.max_fps = max_fps  # 0 leaves the frame rate uncapped
+        self.max_catch_up = max_catch_up
+        self.alpha = 1.0  # How far rendering is between the last two ticks
+        self.frames = 0
+        self.measured_tick_rate = 0.0
+        self.measured_frame_rate = 0.0
+        # Optional instrumentation; F3 toggles the overlay while profiling.
+        if profile or trace_path:
+            self.profiler = FrameProfiler(trace_frames=600 if trace_path else 0)
+        else:
+            self.profiler = NullProfiler()
+        self.trace_path = trace_path
+        self.show_profiler = profile
+        self.profiler_lines = []
         self.running = True
         self.fullscreen = False
+        # Overlays such as the shop; while any is open the simulation is
+        # paused and the top one gets the input.
+        self.scenes = []
+        # An upgrade bought since the last tick; a tick logs at most one.
+        self.purchase_pending = False
+        self.difficulty = dict(DIFFICULTY, **(difficulty or {}))
+        # Broadphase grid over the playfield, rebuilt each tick.
+        self.asteroid_grid = SpatialHash(cell_size=max(ASTEROID_SIZES.values()))
+        # Row -> (x, y, radius) of the asteroids in the grid.
+        self.asteroid_circles = {}
+        self.reset(seed)
+        self.startup["init"] = time.perf_counter() - started
+        self.started = started
+
+    @staticmethod
+    def init_audio():
+        """Start the mixer; without an audio device the game stays silent."""
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            registry.silence()
+
+    def mark_startup(self, phase):
+        """Record the time from the end of init to ``phase`` (once).
+
+        With ``startup_report`` the breakdown is printed to stderr then.
+        """
+        if phase in self.startup:
+            return
+        elapsed = time.perf_counter() - self.started
+        self.startup[phase] = elapsed - self.startup["init"]
+        if self.startup_report:
+            # The phase is already timed; waiting for the background decode
+            # here only holds up the report, so its time can be shown.
+            registry.wait()
+            for line in self.startup_lines():
+                print(line, file=sys.stderr)
+
+    def startup_lines(self):
+        """Return the startup phases as printable lines, in milliseconds."""
+        lines = [
+            f"{phase:<12} {self.startup[phase] * 1000:8.1f} ms"
+            for phase in STARTUP_PHASES
+            if phase in self.startup
+        ]
+        total = sum(self.startup.values())
+        lines.append(f"{'total':<12} {total * 1000:8.1f} ms")
+        if self.headless or registry.silent:
+            lines.append(f"{'assets':<12} {'skipped':>8}")
+        elif registry.preload_seconds is None:
+            lines.append(f"{'assets':<12} {'loading':>8} (background)")
+        else:
+            lines.append(
+                f"{'assets':<12} {registry.preload_seconds * 1000:8.1f} ms "
+                "(background)"
+            )
+        return lines
+
+    def reset(self, seed=None):
+        """Start a new session at level 1, keeping the window and caches."""
         self.game_over = False
         self.level = 1
-        self.player = Player((640, 400), 50, (255, 255, 255))
+        self.ticks = 0
+        # Every random draw in the simulation comes from this stream, so a
+        # seed plus the recorded input reproduces a session exactly.
+        self.seed = seed if seed is not None else self.new_seed()
+        self.rng = random.Random(self.seed)
+        self.player = Player(
+            self.world_center(), 50, (255, 255, 255), bounds=self.world_size
+        )
         self.asteroids = self.create_asteroids(self.level)
-        self.power_ups = []
+        self.particles.clear()
+        self.power_ups = PowerUpSpawner(
+            self.rng, self.world_size, self.tick_rate, **POWER_UPS
+        )
         self.score = 0  # Initialize score
+        self.last_hit = None  # (kind, size) of the asteroid that last hit the ship
+
+    def world_center(self):
+        return (self.world_size[0] / 2, self.world_size[1] / 2)
+
+    def random_position(self):
+        """Return a random whole-pixel point inside the world."""
+        width, height = self.world_size
+        return (self.rng.randint(0, width), self.rng.randint(0, height))
+
+    @staticmethod
+    def new_seed():
+        """Return a fresh seed that fits in a replay header."""
+        return random.randrange(2**63)
 
     def spawn_power_up(self):
-        position = (random.randint(0, 1280), random.randint(0, 800))
-        power_type = random.choice(POWER_UP_TYPES)
-        self.power_ups.append(PowerUp(position, power_type))
+        """Spawn a power-up now, unless the live limit is reached."""
+        return self.power_ups.spawn(self.ticks)
 
     def create_asteroids(self, level):
         # Increase number of asteroids as level increases.
-        asteroids = []
-        num_large = 3 + (level - 1)
-        num_fast = 2 + (level // 2)
-        num_zigzag = 2 + (level // 2)
-        for _ in range(num_large):
-            size = random.choice(list(ASTEROID_SIZES.values()))
-            velocity = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, 2)) * (
-                1 + level * 0.1
-            )
-            asteroids.append(
-                Asteroid(
-                    (random.randint(0, 1280), random.randint(0, 800)),
-                    size,
-                    (255, 0, 0),
-                    velocity,
-                )
-            )
-
-        for _ in range(num_fast):
-            size = random.choice(list(ASTEROID_SIZES.values()))
-            velocity = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, 2)) * (
-                1 + level * 0.1
-            )
-            asteroids.append(
-                FastAsteroid(
-                    (random.randint(0, 1280), random.randint(0, 800)),
-                    size,
-                    (0, 255, 0),
-                    velocity,
+        rng = self.rng
+        difficulty = self.difficulty
+        asteroids = AsteroidField(rng=rng, bounds=self.world_size)
+        num_large = difficulty["large_base"] + difficulty["large_per_level"] * (
+            level - 1
+        )
+        num_fast = difficulty["fast_base"] + (
+            level // difficulty["special_level_divisor"]
+        )
+        num_zigzag = difficulty["zigzag_base"] + (
+            level // difficulty["special_level_divisor"]
+        )
+        speed = 1 + level * difficulty["speed_per_level"]
+        sizes = list(ASTEROID_SIZES.values())
+        for kind, count in (
+            (KIND_NORMAL, num_large),
+            (KIND_FAST, num_fast),
+            (KIND_ZIGZAG, num_zigzag),
+        ):
+            traits = ASTEROID_KINDS[kind]
+            for _ in range(count):
+                size = rng.choice(sizes)
+                velocity = (
+                    pygame.Vector2(rng.uniform(-2, 2), rng.uniform(-2, 2))
+                    * speed
+                    * traits.speed
                 )
-            )
-
-        for _ in range(num_zigzag):
-            size = random.choice(list(ASTEROID_SIZES.values()))
-            velocity = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, 2)) * (
-                1 + level * 0.1
-            )
-            asteroids.append(
-                ZigzagAsteroid(
-                    (random.randint(0, 1280), random.randint(0, 800)),
-                    size,
-                    (0, 0, 255),
-                    velocity,
+                asteroids.add(
+                    self.random_position(), size, traits.color, velocity, kind
                 )
-            )
         return asteroids
 
     def open_shop(self):
-        shop = Shop(self)
-        shop.run()
+        # A replay applies the purchases from its log instead, and a
+        # second purchase has to wait for the tick that logs the first.
+        if not (isinstance(self.input, ReplayInput) or self.purchase_pending):
+            self.scenes.append(Shop(self))
+
+    def buy_upgrade(self, index):
+        """Apply shop upgrade ``index`` and log it for recordings."""
+        UPGRADES[index][1](self.player)
+        self.input.record_purchase(index)
+        self.purchase_pending = True
+
+    def close_scene(self):
+        self.scenes.pop()
+        # The scene covered the whole screen.
+        self.renderer.invalidate()
 
     def next_level(self):
         self.level += 1
         self.asteroids = self.create_asteroids(self.level)
 
     def run(self):
+        step = 1.0 / self.tick_rate
+        accumulator = 0.0
+        previous = time.perf_counter()
+        window_start = previous
+        window_ticks = self.ticks
+        window_frames = self.frames
         while self.running:
-            self.handle_events()
-            if not self.game_over:
+            now = time.perf_counter()
+            accumulator += now - previous
+            previous = now
+
+            profiler = self.profiler
+            profiler.begin_frame()
+            with profiler.span("handle_events"):
+                self.handle_events()
+            steps = 0
+            while accumulator >= step and steps < self.max_catch_up:
+                if not (self.game_over or self.scenes):
+                    with profiler.span("update"):
+                        self.update()
+                accumulator -= step
+                steps += 1
+            if accumulator >= step:
+                # Too far behind (slow machine, debugger): drop the
+                # backlog rather than spiralling.
+                accumulator = 0.0
+            self.alpha = accumulator / step
+            with profiler.span("draw"):
+                self.draw()
+            if profiler.enabled:
+                # Counting polls every reserved channel; skip it unprofiled.
+                counts = dict(self.entity_counts(), voices=self.audio.voices())
+                profiler.end_frame(counts)
+            if self.frames == 1:
+                self.mark_startup("first_frame")
+            self.clock.tick(self.max_fps)
+
+            if now - window_start >= 1.0:
+                elapsed = now - window_start
+                self.measured_tick_rate = (self.ticks - window_ticks) / elapsed
+                self.measured_frame_rate = (self.frames - window_frames) / elapsed
+                window_start = now
+                window_ticks = self.ticks
+                window_frames = self.frames
+
+    def entity_counts(self):
+        return {
+            "asteroids": len(self.asteroids),
+            "bullets": len(self.player.bullets),
+            "power_ups": len(self.power_ups),
+            "particles": len(self.particles),
+        }
+
+    def state_digest(self):
+        """Return a hash of the simulation state, for comparing runs."""
+        digest = hashlib.sha256()
+        count = len(self.asteroids)
+        for array in self.asteroids.state_arrays():
+            digest.update(array[:count].tobytes())
+        bullets = self.player.bullets
+        digest.update(bullets.positions[: len(bullets)].tobytes())
+        digest.update(bullets.velocities[: len(bullets)].tobytes())
+        player = self.player
+        digest.update(
+            repr(
+                (
+                    tuple(player.position),
+                    tuple(player.velocity),
+                    float(player.angle),
+                    player.lives,
+                    player.thrust,
+                    [(tuple(p.position), p.power_type) for p in self.power_ups],
+                    self.score,
+                    self.level,
+                    self.ticks,
+                    self.game_over,
+                )
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    @property
+    def time_ms(self):
+        """Simulated time in milliseconds, advanced one step per tick."""
+        return self.ticks * 1000 / self.tick_rate
+
+    def run_headless(self, ticks):
+        """Simulate up to ``ticks`` steps as fast as possible, without drawing.
+
+        Stops early on game over. Returns the tick count, elapsed seconds
+        and the achieved ticks per second. When profiling, every tick is
+        recorded as one profiler frame.
+        """
+        profiler = self.profiler
+        start = time.perf_counter()
+        done = 0
+        while done < ticks and not self.game_over:
+            if profiler.enabled:
+                profiler.begin_frame()
+                with profiler.span("update"):
+                    self.update()
+                profiler.end_frame(self.entity_counts())
+            else:
                 self.update()
-            self.draw()
-            self.clock.tick(60)
+            done += 1
+            if done == 1:
+                self.mark_startup("first_tick")
+        elapsed = time.perf_counter() - start
+        return {
+            "ticks": done,
+            "seconds": elapsed,
+            "ticks_per_second": done / elapsed if elapsed > 0 else 0.0,
+        }
 
     def display_lives(self):
-        font = pygame.font.Font(None, 36)
-        lives_text = font.render(f"Lives: {self.player.lives}", True, (255, 255, 255))
-        self.screen.blit(lives_text, (10, 50))
+        lives_text = self.text.render(
+            f"Lives: {self.player.lives}", 36, (255, 255, 255)
+        )
+        return self.screen.blit(lives_text, (10, 50))
 
     def draw(self):
-        self.screen.fill((0, 0, 0))
+        self.frames += 1
+        if self.scenes:
+            self.draw_scene(self.scenes[-1])
+            return
+        self.renderer.clear(self.screen)
+        rects = []
         if self.game_over:
-            self.display_game_over()
+            rects.append(self.display_game_over())
         else:
-            self.player.draw(self.screen)
-            for asteroid in self.asteroids:
-                asteroid.draw(self.screen)
+            rects.extend(self.particles.draw(self.screen))
+            rects.extend(self.player.draw(self.screen, self.alpha))
+            rects.extend(self.asteroids.draw(self.screen, self.alpha))
             for power_up in self.power_ups:
-                power_up.draw(self.screen)
-            self.display_score()  # Display the current score
-            self.display_lives()  # Display the player lives
-        pygame.display.flip()
+                rects.append(power_up.draw(self.screen))
+            rects.append(self.display_score())  # Display the current score
+            rects.append(self.display_lives())  # Display the player lives
+        if self.show_profiler and self.profiler.enabled:
+            rects.extend(self.display_profiler())
+        self.renderer.present(self.screen, rects)
+
+    def draw_scene(self, scene):
+        # The world is frozen under the scene, so nothing is presented
+        # unless the scene changed, the window did or the overlay is up.
+        overlay = self.show_profiler and self.profiler.enabled
+        rects = scene.draw(self.screen, self.renderer.needs_full_redraw or overlay)
+        if overlay:
+            rects.extend(self.display_profiler())
+        if rects:
+            self.renderer.present(self.screen, rects)
 
     def display_score(self):
-        font = pygame.font.Font(None, 36)
-        text = font.render(f"Score: {self.score}", True, (255, 255, 255))
-        self.screen.blit(text, (10, 10))
+        text = self.text.render(f"Score: {self.score}", 36, (255, 255, 255))
+        return self.screen.blit(text, (10, 10))
+
+    def display_profiler(self):
+        # Refresh the numbers a few times a second so they stay readable
+        # and the text cache isn't flooded with one-off strings.
+        if self.profiler.frame_index % 15 == 0 or not self.profiler_lines:
+            self.profiler_lines = self.profiler.overlay_lines()
+        rects = []
+        y = 90
+        for line in self.profiler_lines:
+            text = self.text.render(line, 20, (0, 255, 0))
+            rects.append(self.screen.blit(text, (10, y)))
+            y += text.get_height()
+        return rects
 
     def display_game_over(self):
-        font = pygame.font.Font(None, 74)
-        text = font.render("Game Over", True, (255, 0, 0))
-        self.screen.blit(
-            text, (640 - text.get_width() // 2, 400 - text.get_height() // 2)
-        )
+        text = self.text.render("Game Over", 74, (255, 0, 0))
+        return self.screen.blit(text, text.get_rect(center=self.world_center()))
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_f:
-                    self.toggle_fullscreen()
-                elif event.key == pygame.K_SPACE:
-                    self.player.shoot()
-                elif event.key == pygame.K_s:
-                    self.open_shop()
             elif event.type == pygame.VIDEORESIZE:
                 self.resize_screen(event.w, event.h)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                self.toggle_fullscreen()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.show_profiler = not self.show_profiler
+            elif self.scenes:
+                self.scenes[-1].handle_event(event)
+            else:
+                self.input.handle_event(event)
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_s:
+                    self.open_shop()
 
     def toggle_fullscreen(self):
         self.fullscreen = not self.fullscreen
         if self.fullscreen:
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         else:
-            self.screen = pygame.display.set_mode((1280, 800), pygame.RESIZABLE)
+            window = pygame.display.set_mode(self.world_size, pygame.RESIZABLE)
+        self.screen = self.renderer.set_window(window, self.world_size)
 
     def resize_screen(self, width, height):
-        self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        window = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.screen = self.renderer.set_window(window, self.world_size)
 
     def update(self):
-        self.player.update()
-        for asteroid in self.asteroids:
-            asteroid.update()
-        self.check_collisions()
-        self.check_power_up_collection()
+        self.ticks += 1
+        profiler = self.profiler
+        with profiler.span("update.player"):
+            controls = self.input.poll()
+            self.purchase_pending = False
+            purchase = self.input.take_purchase()
+            if purchase is not None:
+                UPGRADES[purchase][1](self.player)
+            self.player.update(controls, self.dt)
+            self.audio.loop("engine", self.player.thrusting)
+            if self.player.thrusting:
+                rear, forward = self.player.exhaust()
+                self.particles.exhaust(rear, forward, self.player.velocity)
+            if controls.shoot and self.player.shoot():
+                self.audio.play("laser", self.time_ms)
+        with profiler.span("update.asteroids"):
+            self.asteroids.update(self.dt)
+        with profiler.span("update.particles"):
+            self.particles.update(self.dt)
+        with profiler.span("update.collisions"):
+            self.check_collisions()
+        with profiler.span("update.power_ups"):
+            self.power_ups.update(self.ticks)
+            self.check_power_up_collection()
         # Advance to the next level when there are no asteroids left.
         if not self.asteroids:
             self.next_level()
 
-    def check_power_up_collection(self):
-        for power_up in self.power_ups[:]:
-            if self.is_collision(self.player, power_up):
-                self.apply_power_up(power_up)
+    def check_power_up_collection(self, player=None):
+        player = self.player if player is None else player
+        # Only power-ups in the grid cells around the ship are tested.
+        nearby = self.power_ups.near(player.position, player.get_collision_radius())
+        for power_up in nearby:
+            if self.is_collision(player, power_up):
+                self.apply_power_up(power_up, player)
                 self.power_ups.remove(power_up)
 
-    def apply_power_up(self, power_up):
-        if power_up.power_type == "extra_life":
-            self.player.lives += 1
-        elif power_up.power_type == "increased_speed":
-            self.player.thrust *= 1.5
-        elif power_up.power_type == "shield":
-            self.player.shield = True
-            # Add logic to handle shield duration and effect
+    def apply_power_up(self, power_up, player=None):
+        power_up.apply(self.player if player is None else player)
 
     def check_collisions(self):
         # Check collisions between bullets and asteroids.
-        for bullet in self.player.bullets[:]:
-            for asteroid in self.asteroids[:]:
-                if self.is_collision(bullet, asteroid):
-                    self.player.bullets.remove(bullet)
-                    self.asteroids.remove(asteroid)
-                    self.asteroids.extend(asteroid.split())
-                    self.score += 10  # Increase score
-                    break
+        self.index_asteroids([self.player.bullets])
+        self.score += 10 * self.resolve_bullet_hits(self.player.bullets)
 
         # Check collisions between the player and asteroids.
-        for asteroid in self.asteroids:
-            if self.is_collision(self.player, asteroid):
-                if not self.player.is_invulnerable():
-                    self.player.lives -= 1
-                    self.player.last_hit_time = pygame.time.get_ticks()
-                    if self.player.lives <= 0:
-                        self.game_over = True
-                    # Reset the level instead of setting game_over
-                    self.asteroids = self.create_asteroids(self.level)
-                    # Optionally reset player status (position/velocity)
-                    self.player.position = pygame.Vector2(640, 400)
-                    self.player.velocity = pygame.Vector2(0, 0)
-                break
+        asteroid = self.asteroid_hitting(self.player)
+        if asteroid is not None and not self.player.is_invulnerable(self.time_ms):
+            self.player.lives -= 1
+            self.player.last_hit_time = self.time_ms
+            self.last_hit = (KIND_NAMES[asteroid.kind], asteroid.size)
+            if self.player.lives <= 0:
+                self.game_over = True
+            # Reset the level instead of setting game_over
+            self.asteroids = self.create_asteroids(self.level)
+            # Optionally reset player status (position/velocity)
+            self.player.position = pygame.Vector2(self.world_center())
+            self.player.previous_position = pygame.Vector2(self.world_center())
+            self.player.velocity = pygame.Vector2(0, 0)
 
         # Advance to the next level when there are no asteroids left.
         if not self.asteroids:
             self.level += 1
             self.asteroids = self.create_asteroids(self.level)
 
-    def is_collision(self, obj1, obj2):
-        # Compute the distance between the centers.
-        distance = math.hypot(
-            obj2.position.x - obj1.position.x, obj2.position.y - obj1.position.y
+    def resolve_bullet_hits(self, bullets):
+        """Split the asteroids hit by a bullet pool; return how many were hit.
+
+        Uses the grid built by index_asteroids. Hits remove asteroid rows,
+        so the grid must be rebuilt before resolving another pool.
+        """
+        # The grid only yields nearby pairs; removals are applied once all
+        # hits are known.
+        hit_bullets = set()
+        hit_asteroids = set()
+        bullet_radius = bullets.size
+        bullet_positions = bullets.positions[: len(bullets)].tolist()
+        circles = self.asteroid_circles
+        pairs = self.bullet_asteroid_pairs(bullet_positions, bullet_radius)
+        for bullet_index, asteroid_index in pairs:
+            if bullet_index in hit_bullets or asteroid_index in hit_asteroids:
+                continue
+            # Both are circles, so is_collision's bounding test is the whole
+            # test; done on the plain lists, it allocates nothing per pair.
+            x, y = bullet_positions[bullet_index]
+            asteroid_x, asteroid_y, asteroid_radius = circles[asteroid_index]
+            dx = asteroid_x - x
+            dy = asteroid_y - y
+            reach = bullet_radius + asteroid_radius
+            if dx * dx + dy * dy <= reach * reach:
+                hit_bullets.add(bullet_index)
+                hit_asteroids.add(asteroid_index)
+        if not hit_asteroids:
+            return 0
+
+        bullets.remove(hit_bullets)
+        # Fragments are appended past the hit rows, so removing the hit rows
+        # afterwards leaves them intact.
+        hit_asteroids = sorted(hit_asteroids)
+        for index in hit_asteroids:
+            # Coalesced by the audio manager when several land at once.
+            self.audio.play("explosion", self.time_ms)
+            self.particles.explode(
+                self.asteroids.positions[index],
+                int(self.asteroids.sizes[index]) // 2,
+                self.asteroids.colors[index].tolist(),
+            )
+        self.asteroids.split(hit_asteroids)
+        self.asteroids.remove(hit_asteroids)
+        return len(hit_asteroids)
+
+    def asteroid_hitting(self, player):
+        """Return the first asteroid touching the ship, or None."""
+        nearby = self.asteroids.near(player.position, player.get_collision_radius())
+        for index in nearby:
+            asteroid = self.asteroids[index]
+            if self.is_collision(player, asteroid):
+                return asteroid
+        return None
+
+    def index_asteroids(self, pools):
+        """Rebuild the broadphase grid for the bullets of ``pools``.
+
+        Only asteroids that share a grid cell with some bullet can pair
+        with one, so the rest are filtered out with NumPy and just the
+        candidates are inserted.
+        """
+        grid = self.asteroid_grid
+        grid.clear()
+        self.asteroid_circles = circles = {}
+        pools = [bullets for bullets in pools if len(bullets)]
+        count = len(self.asteroids)
+        if not pools or not count:
+            return
+        cell_size = grid.cell_size
+        positions = self.asteroids.positions[:count]
+        radii = self.asteroids.sizes[:count] / 2
+        if 2 * max(radii.max(), *(bullets.size for bullets in pools)) > cell_size:
+            # Corner cells would miss some cells; index every asteroid.
+            for index, ((x, y), radius) in enumerate(
+                zip(positions.tolist(), radii.tolist())
+            ):
+                circles[index] = (x, y, radius)
+                grid.insert(index, x, y, radius)
+            return
+        bullet_cells = np.concatenate(
+            [
+                corner_cell_keys(
+                    bullets.positions[: len(bullets)], bullets.size, cell_size
+                ).ravel()
+                for bullets in pools
+            ]
+        )
+        asteroid_cells = corner_cell_keys(positions, radii, cell_size)
+        shared = np.isin(asteroid_cells, bullet_cells).any(axis=1)
+        candidates = np.flatnonzero(shared)
+        positions = positions[candidates]
+        radii = radii[candidates]
+        grid.insert_many(candidates, positions, radii)
+        circles.update(
+            zip(
+                candidates.tolist(),
+                zip(*positions.T.tolist(), radii.tolist()),
+            )
         )
 
-        # Use get_collision_radius if available, otherwise default to half of size.
-        radius1 = getattr(obj1, "get_collision_radius", lambda: obj1.size / 2)()
-        radius2 = getattr(obj2, "get_collision_radius", lambda: obj2.size / 2)()
+    def bullet_asteroid_pairs(self, positions, bullet_radius):
+        """Yield (bullet index, asteroid index) pairs that share a grid cell."""
+        grid = self.asteroid_grid
+        for bullet_index, (x, y) in enumerate(positions):
+            candidates = grid.query(x, y, bullet_radius)
+            # Sorted so a bullet hits asteroids in list order, as before.
+            for asteroid_index in sorted(candidates):
+                yield bullet_index, asteroid_index
 
-        # Fast bounding circle test.
-        if distance > (radius1 + radius2):
+    def is_collision(self, obj1, obj2):
+        # Bounding circle test on squared distances.
+        p1 = obj1.position
+        p2 = obj2.position
+        dx = p2.x - p1.x
+        dy = p2.y - p1.y
+        reach = obj1.get_collision_radius() + obj2.get_collision_radius()
+        if dx * dx + dy * dy > reach * reach:
             return False
 
-        # Prepare offset for precise mask collision check.
+        # Two circles that pass the bounding test are touching.
+        if obj1.collision_shape == "circle" and obj2.collision_shape == "circle":
+            return True
+
+        # Anything else ("polygon", "mask") falls back to a precise mask
+        # check; the offset is between the top-left corners of both masks.
+        mask1 = obj1.mask
+        mask2 = obj2.mask
+        width1, height1 = mask1.get_size()
+        width2, height2 = mask2.get_size()
         offset = (
-            int(obj2.position.x - obj1.position.x),
-            int(obj2.position.y - obj1.position.y),
+            int(dx - width2 / 2 + width1 / 2),
+            int(dy - height2 / 2 + height1 / 2),
         )
-        return obj1.mask.overlap(obj2.mask, offset) is not None
+        return mask1.overlap(mask2, offset) is not None
 
     def quit(self):
+        self.audio.stop_all()
+        self.input.close()
+        if self.trace_path:
+            self.profiler.write_trace(self.trace_path)
         pygame.quit()
         sys.exit()
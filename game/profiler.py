@@ -0,0 +1,195 @@
+"""Per-frame timing instrumentation, overlay and Chrome trace export."""
+
+import json
+import sys
+import time
+from collections import deque
+
+# Spans shown on the overlay, in display order.
+OVERLAY_SPANS = (
+    "frame",
+    "handle_events",
+    "update",
+    "update.player",
+    "update.asteroids",
+    "update.particles",
+    "update.collisions",
+    "update.power_ups",
+    "draw",
+)
+
+
+class _Span:
+    """Context manager that records one named duration into a profiler."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+
+class _NullSpan:
+    """Span that records nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class NullProfiler:
+    """Profiler stand-in used when instrumentation is off."""
+
+    enabled = False
+
+    def span(self, name):
+        return NULL_SPAN
+
+    def begin_frame(self):
+        pass
+
+    def end_frame(self, counts=None):
+        pass
+
+
+class FrameProfiler:
+    """Rolling per-span frame timings, entity counts and allocation deltas.
+
+    Keeps the last ``window`` samples of every span for percentiles. When
+    ``trace_frames`` is set, the last that many frames are also kept as
+    Chrome trace events (load them in chrome://tracing or Perfetto).
+    """
+
+    enabled = True
+
+    def __init__(self, window=300, trace_frames=0):
+        self.window = window
+        self.samples = {}
+        self.counts = {}
+        self.allocations = deque(maxlen=window)
+        self.trace_frames = trace_frames
+        self.trace = deque()
+        self.frame_events = []
+        self.frame_index = 0
+        self._origin = time.perf_counter()
+        self._frame_start = 0.0
+        self._blocks_at_start = 0
+
+    def span(self, name):
+        """Return a context manager that times the enclosed block."""
+        return _Span(self, name)
+
+    def record(self, name, start, end):
+        """Store one timed span (perf_counter seconds)."""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(end - start)
+        if self.trace_frames:
+            self.frame_events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": 0,
+                    "tid": 0,
+                }
+            )
+
+    def begin_frame(self):
+        """Mark the start of a frame."""
+        self._frame_start = time.perf_counter()
+        self._blocks_at_start = sys.getallocatedblocks()
+
+    def end_frame(self, counts=None):
+        """Close the frame, recording its duration and entity counts."""
+        end = time.perf_counter()
+        self.record("frame", self._frame_start, end)
+        self.allocations.append(sys.getallocatedblocks() - self._blocks_at_start)
+        for name, value in (counts or {}).items():
+            history = self.counts.get(name)
+            if history is None:
+                history = self.counts[name] = deque(maxlen=self.window)
+            history.append(value)
+        if self.trace_frames:
+            if counts:
+                self.frame_events.append(
+                    {
+                        "name": "entities",
+                        "ph": "C",
+                        "ts": (end - self._origin) * 1e6,
+                        "pid": 0,
+                        "args": dict(counts),
+                    }
+                )
+            self.trace.append(self.frame_events)
+            self.frame_events = []
+            while len(self.trace) > self.trace_frames:
+                self.trace.popleft()
+        self.frame_index += 1
+
+    def percentiles(self, name, points=(50, 95, 99)):
+        """Return {point: milliseconds} for a span over the rolling window."""
+        samples = self.samples.get(name)
+        if not samples:
+            return {point: 0.0 for point in points}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            point: ordered[min(last, int(len(ordered) * point / 100))] * 1000
+            for point in points
+        }
+
+    def summary(self):
+        """Return percentiles per span plus the latest counts and allocations."""
+        return {
+            "spans": {name: self.percentiles(name) for name in self.samples},
+            "counts": {name: values[-1] for name, values in self.counts.items()},
+            "allocated_blocks_per_frame": (
+                sum(self.allocations) / len(self.allocations)
+                if self.allocations
+                else 0.0
+            ),
+        }
+
+    def write_trace(self, path):
+        """Write the buffered frames as a Chrome trace JSON file."""
+        events = [event for frame in self.trace for event in frame]
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, handle)
+
+    def overlay_lines(self):
+        """Return the text lines shown by the profiling overlay."""
+        lines = []
+        for name in OVERLAY_SPANS:
+            if name in self.samples:
+                p = self.percentiles(name)
+                lines.append(
+                    f"{name:<18} p50 {p[50]:6.2f}  p95 {p[95]:6.2f}  "
+                    f"p99 {p[99]:6.2f} ms"
+                )
+        counts = "  ".join(
+            f"{name} {values[-1]}" for name, values in self.counts.items()
+        )
+        if counts:
+            lines.append(counts)
+        if self.allocations:
+            lines.append(f"blocks/frame {self.allocations[-1]:+d}")
+        return lines
@@ -0,0 +1,125 @@
+"""Frame presentation with optional dirty-rectangle updates."""
+
+import pygame
+
+RENDER_MODES = ("full", "dirty")
+
+
+class Renderer:
+    """Clears and presents frames, either whole or by changed rectangles.
+
+    In "dirty" mode only last frame's rectangles are cleared and only the
+    union of last and current rectangles is pushed to the display. When
+    those rectangles cover more than ``full_flip_ratio`` of the screen a
+    plain flip is cheaper, so the renderer falls back to one.
+
+    With ``to_display=False`` frames stay on the (off-screen) surface and
+    nothing is pushed to a window.
+
+    Frames are drawn at the logical playfield size. When the window is a
+    different size, ``set_window`` hands out an off-screen canvas instead
+    and ``present`` scales it into the window with a single blit.
+    """
+
+    def __init__(
+        self, mode="full", background=(0, 0, 0), full_flip_ratio=0.5, to_display=True
+    ):
+        if mode not in RENDER_MODES:
+            raise ValueError(f"unknown render mode: {mode!r}")
+        self.mode = mode
+        self.background = background
+        self.full_flip_ratio = full_flip_ratio
+        self.to_display = to_display
+        self.previous_rects = []
+        self.needs_full_redraw = True
+        self.window = None
+        self.canvas = None
+        # Letterboxed area of the window the canvas is scaled into; only
+        # recomputed when the window changes.
+        self.target = None
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        """Force the next frame to clear and flip the whole screen."""
+        self.needs_full_redraw = True
+
+    def set_window(self, window, logical_size):
+        """Present to a new or resized window; return the surface to draw on.
+
+        The window itself is returned when it already has the logical size,
+        so the common case costs no extra blit.
+        """
+        self.window = window
+        self.invalidate()
+        logical_size = tuple(logical_size)
+        if window.get_size() == logical_size:
+            self.canvas = None
+            self.target = None
+            return window
+        if self.canvas is None or self.canvas.get_size() != logical_size:
+            self.canvas = pygame.Surface(logical_size).convert(window)
+        self.target = window.subsurface(_fit(logical_size, window.get_size()))
+        return self.canvas
+
+    def clear(self, screen):
+        """Erase what was drawn last frame."""
+        if self.mode == "full" or self.needs_full_redraw:
+            screen.fill(self.background)
+            return
+        for rect in self.previous_rects:
+            screen.fill(self.background, rect)
+
+    def present(self, screen, rects):
+        """Push this frame to the display given the rectangles drawn."""
+        rects = [rect for rect in rects if rect]
+        if self.target is not None:
+            self._present_scaled(screen, rects)
+            return
+        if self.mode == "full":
+            self._flip()
+            return
+
+        dirty = self.previous_rects + rects
+        self.previous_rects = rects
+        coverage = self._coverage(screen, dirty)
+        if self.needs_full_redraw or coverage > self.full_flip_ratio:
+            self._flip()
+        else:
+            if self.to_display:
+                pygame.display.update(dirty)
+            self.partial_frames += 1
+
+    def _present_scaled(self, screen, rects):
+        # Scaling touches every pixel anyway, so the whole window is flipped.
+        if self.needs_full_redraw:
+            self.window.fill(self.background)  # Letterbox bars
+        self.previous_rects = rects
+        pygame.transform.scale(screen, self.target.get_size(), self.target)
+        self._flip()
+
+    def _flip(self):
+        # A flip pushes the whole screen, so nothing is left to catch up on.
+        if self.to_display:
+            pygame.display.flip()
+        self.needs_full_redraw = False
+        self.full_frames += 1
+
+    def _coverage(self, screen, rects):
+        # Overlaps are counted twice, which only errs towards a full flip.
+        screen_rect = screen.get_rect()
+        area = 0
+        for rect in rects:
+            visible = rect.clip(screen_rect)
+            area += visible.width * visible.height
+        return area / max(1, screen_rect.width * screen_rect.height)
+
+
+def _fit(size, window_size):
+    """Largest rect with the aspect ratio of size, centered in window_size."""
+    width, height = size
+    window_width, window_height = window_size
+    scale = min(window_width / width, window_height / height)
+    rect = pygame.Rect(0, 0, round(width * scale), round(height * scale))
+    rect.center = (window_width // 2, window_height // 2)
+    return rect
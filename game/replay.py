@@ -0,0 +1,113 @@
+"""Compact binary recording and playback of per-tick input."""
+
+import struct
+
+from .controls import NO_CONTROLS, Controls, InputSource
+
+MAGIC = b"SSRP"
+VERSION = 2
+# Version 1 logs are read as-is; they just never contain a purchase.
+READABLE_VERSIONS = (1, VERSION)
+# magic, version, seed, tick rate
+HEADER = struct.Struct("<4sHqH")
+
+# One byte per tick; each Controls field is one bit, in field order. The
+# bits above hold 1 + the index of a shop upgrade bought before the tick.
+_BITS = tuple(1 << index for index in range(len(Controls._fields)))
+_PURCHASE_SHIFT = len(Controls._fields)
+
+
+def encode_controls(controls):
+    """Pack Controls into a single byte."""
+    value = 0
+    for bit, pressed in zip(_BITS, controls):
+        if pressed:
+            value |= bit
+    return value
+
+
+def decode_controls(value):
+    """Unpack a byte written by encode_controls."""
+    return Controls(*(bool(value & bit) for bit in _BITS))
+
+
+# Every possible byte decoded once, so playback never builds tuples.
+_DECODED = tuple(decode_controls(value) for value in range(256))
+
+
+class RecordingInput(InputSource):
+    """Wraps another input source and logs what it returns each tick.
+
+    The log starts with the game's seed and tick rate, so a ReplayInput
+    can rebuild the same Game and feed it the same Controls.
+    """
+
+    def __init__(self, source, path, seed, tick_rate):
+        self.source = source
+        self.handle = open(path, "wb")
+        self.handle.write(HEADER.pack(MAGIC, VERSION, seed, tick_rate))
+        self.buffer = bytearray()
+        self.purchase = 0  # Logged with the next tick
+
+    def handle_event(self, event):
+        self.source.handle_event(event)
+
+    def record_purchase(self, index):
+        if self.purchase:
+            raise RuntimeError("only one purchase can be logged per tick")
+        self.purchase = (index + 1) << _PURCHASE_SHIFT
+
+    def poll(self):
+        controls = self.source.poll()
+        self.buffer.append(encode_controls(controls) | self.purchase)
+        self.purchase = 0
+        if len(self.buffer) >= 4096:
+            self.flush()
+        return controls
+
+    def flush(self):
+        """Write buffered ticks to disk."""
+        self.handle.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        if not self.handle.closed:
+            self.flush()
+            self.handle.close()
+
+
+class ReplayInput(InputSource):
+    """Feeds recorded Controls and shop purchases back one tick at a time."""
+
+    def __init__(self, path):
+        with open(path, "rb") as handle:
+            data = handle.read()
+        magic, version, seed, tick_rate = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an input recording")
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"unsupported recording version {version}")
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.ticks = data[HEADER.size :]
+        self.position = 0
+        self.purchase = None  # Upgrade index logged with the last tick
+
+    @property
+    def finished(self):
+        """True once every recorded tick has been played back."""
+        return self.position >= len(self.ticks)
+
+    def poll(self):
+        if self.finished:
+            self.purchase = None
+            return NO_CONTROLS
+        value = self.ticks[self.position]
+        self.position += 1
+        purchase = value >> _PURCHASE_SHIFT
+        self.purchase = purchase - 1 if purchase else None
+        return _DECODED[value]
+
+    def take_purchase(self):
+        purchase, self.purchase = self.purchase, None
+        return purchase
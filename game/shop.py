@@ -2,76 +2,101 @@
 
 import pygame
 
+NORMAL_COLOR = (255, 255, 255)
+SELECTED_COLOR = (255, 255, 0)
+
+
+def _upgrade_thrust(player):
+    # Increases the thrust of the player.
+    player.thrust += 0.05
+
+
+def _extra_life(player):
+    # Adds an extra life to the player.
+    player.lives += 1
+
+
+def _activate_shield(player):
+    # Activates the player's shield.
+    player.shield = True
+
+
+# Label and effect of each upgrade, in menu order. Recordings store the
+# index, so new upgrades go at the end (at most seven fit).
+UPGRADES = (
+    ("Increase Thrust", _upgrade_thrust),
+    ("Extra Life", _extra_life),
+    ("Activate Shield", _activate_shield),
+)
+
 
 class Shop:
+    """Upgrade menu drawn over the frozen game as a scene on Game.scenes.
+
+    The dimmed backdrop and every label are rendered once when the shop
+    opens; after that a frame is only drawn when the selection changes.
+    """
+
     def __init__(self, game):
         self.game = game
-        self.screen = game.screen
-        self.font = pygame.font.Font(None, 36)
-        # Each option includes a label and an upgrade function.
-        self.options = [
-            ("Increase Thrust", self.upgrade_thrust),
-            ("Extra Life", self.extra_life),
-            ("Activate Shield", self.activate_shield),
-        ]
+        self.text = game.text
+        self.options = UPGRADES
         self.selected = 0  # current selection index
+        self.dirty = True  # The selection changed since the last draw
+        self.backdrop = self.build_backdrop(game.screen)
+        self.labels = self.build_labels(self.backdrop.get_width())
 
-    def run(self):
-        shop_open = True
-        while shop_open:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.quit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        shop_open = False
-                    elif event.key == pygame.K_UP:
-                        self.selected = (self.selected - 1) % len(self.options)
-                    elif event.key == pygame.K_DOWN:
-                        self.selected = (self.selected + 1) % len(self.options)
-                    elif event.key == pygame.K_RETURN:
-                        # Execute the selected upgrade function.
-                        self.options[self.selected][1]()
-                        shop_open = False
-
-            self.draw()
-            pygame.display.flip()
-            self.game.clock.tick(60)
-
-    def draw(self):
-        # Dim the background.
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+    def build_backdrop(self, screen):
+        # The last game frame, dimmed, with the title on top.
+        backdrop = screen.copy()
+        overlay = pygame.Surface(backdrop.get_size(), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-
-        # Draw shop title.
-        title_surf = self.font.render("Upgrade Shop", True, (255, 255, 255))
-        self.screen.blit(
-            title_surf,
-            (self.screen.get_width() // 2 - title_surf.get_width() // 2, 100),
+        backdrop.blit(overlay, (0, 0))
+        title_surf = self.text.render("Upgrade Shop", 36, NORMAL_COLOR)
+        backdrop.blit(
+            title_surf, (backdrop.get_width() // 2 - title_surf.get_width() // 2, 100)
         )
+        return backdrop
 
-        # Draw each upgrade option.
+    def build_labels(self, width):
+        # (normal, selected, position) for each option.
         start_y = 200
-        for i, option in enumerate(self.options):
-            color = (255, 255, 0) if i == self.selected else (255, 255, 255)
-            option_text = self.font.render(option[0], True, color)
-            self.screen.blit(
-                option_text,
-                (
-                    self.screen.get_width() // 2 - option_text.get_width() // 2,
-                    start_y + i * 40,
-                ),
-            )
-
-    def upgrade_thrust(self):
-        # Increases the thrust of the player.
-        self.game.player.thrust += 0.05
-
-    def extra_life(self):
-        # Adds an extra life to the player.
-        self.game.player.lives += 1
-
-    def activate_shield(self):
-        # Activates the player's shield.
-        self.game.player.shield = True
+        labels = []
+        for i, (label, _) in enumerate(self.options):
+            normal = self.text.render(label, 36, NORMAL_COLOR)
+            selected = self.text.render(label, 36, SELECTED_COLOR)
+            position = (width // 2 - normal.get_width() // 2, start_y + i * 40)
+            labels.append((normal, selected, position))
+        return labels
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.game.close_scene()
+        elif event.key == pygame.K_UP:
+            self.select(self.selected - 1)
+        elif event.key == pygame.K_DOWN:
+            self.select(self.selected + 1)
+        elif event.key == pygame.K_RETURN:
+            self.game.buy_upgrade(self.selected)
+            self.game.close_scene()
+
+    def select(self, index):
+        self.selected = index % len(self.options)
+        self.dirty = True
+
+    def draw(self, screen, force=False):
+        """Draw the shop if anything changed; return the rects drawn."""
+        if not (self.dirty or force):
+            return []
+        self.dirty = False
+        rect = screen.blit(self.backdrop, (0, 0))
+        screen.blits(
+            [
+                (selected if i == self.selected else normal, position)
+                for i, (normal, selected, position) in enumerate(self.labels)
+            ],
+            doreturn=False,
+        )
+        return [rect]
@@ -0,0 +1,234 @@
+"""Versioned binary snapshots of the full simulation state.
+
+A snapshot is a few fixed-size struct records followed by the raw bytes of
+the asteroid, bullet and power-up arrays, so saving a large field is a
+handful of ``tobytes`` calls rather than pickling Surfaces. Layout::
+
+    header   magic, version, seed, level, score, ticks, game_over
+    player   kinematics, upgrades, lives and invulnerability timer
+    counts   asteroids, bullets, bullet capacity, power-ups
+    spawner  tick the next power-up is due
+    rng      Mersenne Twister state of Game.rng
+    arrays   asteroid columns, bullet columns, power-up columns
+"""
+
+import os
+import struct
+from collections import deque
+
+import numpy as np
+import pygame
+
+from entities.asteroid_field import AsteroidField
+from entities.bullet import BulletPool
+from entities.powerup import POWER_UP_TYPES, PowerUp
+
+from .game import Game
+
+MAGIC = b"SSSN"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHqiqq?")
+_PLAYER = struct.Struct("<9did??")
+_COUNTS = struct.Struct("<4I")
+_SPAWNER = struct.Struct("<q")
+_RNG = struct.Struct("<625I?d")
+
+# (attribute, dtype, columns) for each AsteroidField array, in file order.
+_ASTEROID_ARRAYS = (
+    ("positions", np.float64, 2),
+    ("velocities", np.float64, 2),
+    ("sizes", np.int32, 1),
+    ("colors", np.uint8, 3),
+    ("kinds", np.int8, 1),
+    ("zigzag_directions", np.float64, 1),
+)
+
+
+def dumps(game):
+    """Serialize a Game's simulation state to bytes."""
+    player = game.player
+    asteroids = game.asteroids
+    bullets = player.bullets
+    count = len(asteroids)
+    bullet_count = len(bullets)
+    _, mt_state, gauss = game.rng.getstate()
+
+    parts = [
+        _HEADER.pack(
+            MAGIC,
+            VERSION,
+            game.seed,
+            game.level,
+            game.score,
+            game.ticks,
+            game.game_over,
+        ),
+        _PLAYER.pack(
+            player.position.x,
+            player.position.y,
+            player.velocity.x,
+            player.velocity.y,
+            player.angle,
+            player.thrust,
+            player.rotation_speed,
+            player.slowdown,
+            player.last_hit_time,
+            player.lives,
+            player.invulnerability_duration,
+            getattr(player, "shield", False),
+            player.thrusting,
+        ),
+        _COUNTS.pack(count, bullet_count, bullets.capacity, len(game.power_ups)),
+        _SPAWNER.pack(game.power_ups.next_spawn),
+        _RNG.pack(*mt_state, gauss is not None, gauss or 0.0),
+    ]
+    for name, _, _ in _ASTEROID_ARRAYS:
+        parts.append(getattr(asteroids, name)[:count].tobytes())
+    parts.append(bullets.positions[:bullet_count].tobytes())
+    parts.append(bullets.velocities[:bullet_count].tobytes())
+    parts.append(
+        np.array(
+            [(p.position.x, p.position.y) for p in game.power_ups], dtype=np.float64
+        ).tobytes()
+    )
+    parts.append(bytes(POWER_UP_TYPES.index(p.power_type) for p in game.power_ups))
+    parts.append(
+        np.array(
+            [-1 if p.expires_at is None else p.expires_at for p in game.power_ups],
+            dtype=np.int64,
+        ).tobytes()
+    )
+    return b"".join(parts)
+
+
+def loads(game, data):
+    """Restore a snapshot produced by dumps into an existing Game."""
+    view = memoryview(data)
+    magic, version, seed, level, score, ticks, game_over = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("not a game snapshot")
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    offset = _HEADER.size
+    player_state = _PLAYER.unpack_from(view, offset)
+    offset += _PLAYER.size
+    count, bullet_count, bullet_capacity, power_up_count = _COUNTS.unpack_from(
+        view, offset
+    )
+    offset += _COUNTS.size
+    (next_spawn,) = _SPAWNER.unpack_from(view, offset)
+    offset += _SPAWNER.size
+    rng_state = _RNG.unpack_from(view, offset)
+    offset += _RNG.size
+
+    game.seed = seed
+    game.level = level
+    game.score = score
+    game.ticks = ticks
+    game.game_over = game_over
+    gauss = rng_state[626] if rng_state[625] else None
+    game.rng.setstate((3, rng_state[:625], gauss))
+
+    x, y, vx, vy, angle, thrust, rotation_speed, slowdown, last_hit_time = (
+        player_state[:9]
+    )
+    player = game.player
+    player.position = pygame.Vector2(x, y)
+    player.previous_position = pygame.Vector2(x, y)
+    player.velocity = pygame.Vector2(vx, vy)
+    player.angle = angle
+    player.thrust = thrust
+    player.rotation_speed = rotation_speed
+    player.slowdown = slowdown
+    player.last_hit_time = last_hit_time
+    player.lives = player_state[9]
+    player.invulnerability_duration = player_state[10]
+    player.shield = player_state[11]
+    player.thrusting = player_state[12]
+
+    asteroids = AsteroidField(
+        capacity=max(count, 64), rng=game.rng, bounds=game.world_size
+    )
+    for name, dtype, columns in _ASTEROID_ARRAYS:
+        array, offset = _read_array(view, offset, dtype, count, columns)
+        getattr(asteroids, name)[:count] = array
+    asteroids.previous_positions[:count] = asteroids.positions[:count]
+    asteroids.count = count
+    game.asteroids = asteroids
+
+    bullets = BulletPool(bullet_capacity, bounds=game.world_size)
+    positions, offset = _read_array(view, offset, np.float64, bullet_count, 2)
+    velocities, offset = _read_array(view, offset, np.float64, bullet_count, 2)
+    bullets.positions[:bullet_count] = positions
+    bullets.previous_positions[:bullet_count] = positions
+    bullets.velocities[:bullet_count] = velocities
+    bullets.count = bullet_count
+    player.bullets = bullets
+
+    positions, offset = _read_array(view, offset, np.float64, power_up_count, 2)
+    types = view[offset : offset + power_up_count]
+    offset += power_up_count
+    expiries, offset = _read_array(view, offset, np.int64, power_up_count, 1)
+    spawner = game.power_ups
+    spawner.clear()
+    for position, kind, expires_at in zip(
+        positions.tolist(), types, expiries.tolist()
+    ):
+        expires_at = None if expires_at < 0 else expires_at
+        spawner.add(PowerUp(tuple(position), POWER_UP_TYPES[kind], expires_at))
+    spawner.next_spawn = next_spawn
+    return game
+
+
+def _read_array(view, offset, dtype, rows, columns):
+    size = rows * columns
+    array = np.frombuffer(view, dtype=dtype, count=size, offset=offset)
+    if columns > 1:
+        array = array.reshape(rows, columns)
+    return array, offset + array.nbytes
+
+
+def save(game, path):
+    """Write a snapshot to path atomically (safe for autosave)."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(dumps(game))
+    os.replace(temporary, path)
+
+
+def load(game, path):
+    """Restore the snapshot stored at path into game."""
+    with open(path, "rb") as handle:
+        return loads(game, handle.read())
+
+
+def fork(game, **options):
+    """Return a new headless Game in the same state as game."""
+    options.setdefault("headless", True)
+    options.setdefault("world_size", game.world_size)
+    clone = Game(tick_rate=game.tick_rate, difficulty=game.difficulty, **options)
+    return loads(clone, dumps(game))
+
+
+class RewindBuffer:
+    """Keeps the most recent snapshots in memory for rewinding."""
+
+    def __init__(self, capacity=600):
+        self.snapshots = deque(maxlen=capacity)
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    def push(self, game):
+        """Record the current state of game."""
+        self.snapshots.append(dumps(game))
+
+    def rewind(self, game, steps=1):
+        """Restore the state from ``steps`` pushes ago, dropping newer ones."""
+        if not self.snapshots:
+            raise IndexError("rewind buffer is empty")
+        steps = min(steps, len(self.snapshots))
+        for _ in range(steps - 1):
+            self.snapshots.pop()
+        return loads(game, self.snapshots[-1])
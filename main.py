@@ -1,10 +1,123 @@
-from game.game import Game
+import argparse
+import time
 
 
-def main():
-    game = Game()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Asteroids clone.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="simulate without a window or audio and report ticks per second",
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=10000, help="ticks to simulate when headless"
+    )
+    parser.add_argument(
+        "--input",
+        choices=("random", "idle"),
+        default="random",
+        help="input source when headless",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="seed for the game and random input"
+    )
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument(
+        "--max-fps", type=int, default=60, help="frame rate cap (0 = uncapped)"
+    )
+    parser.add_argument("--render-mode", choices=("full", "dirty"), default="full")
+    parser.add_argument(
+        "--profile", action="store_true", help="show the frame profiler (F3 toggles)"
+    )
+    parser.add_argument(
+        "--trace", metavar="FILE", help="write a Chrome trace of recent frames on exit"
+    )
+    parser.add_argument("--record", metavar="FILE", help="record per-tick input")
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="play back a recording (as fast as possible with --headless)",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print import, init, asset and first-frame times to stderr",
+    )
+    args = parser.parse_args(argv)
+    if args.record and args.replay:
+        parser.error("--record can't be combined with --replay")
+    return args
+
+
+def build_input(args, seed, tick_rate):
+    """Return the live input source described by the command line."""
+    from game.controls import InputSource, KeyboardInput, RandomInput
+    from game.replay import RecordingInput
+
+    if not args.headless:
+        source = KeyboardInput()
+    elif args.input == "random":
+        source = RandomInput(seed)
+    else:
+        source = InputSource()
+    if args.record:
+        source = RecordingInput(source, args.record, seed, tick_rate)
+    return source
+
+
+def run_headless(args, game):
+    if args.replay:
+        ticks = len(game.input.ticks)
+    else:
+        ticks = args.ticks
+    result = game.run_headless(ticks)
+    game.input.close()
+    if args.trace:
+        game.profiler.write_trace(args.trace)
+    if args.profile:
+        for line in game.profiler.overlay_lines():
+            print(line)
+    print(
+        f"{result['ticks']} ticks in {result['seconds']:.3f}s "
+        f"({result['ticks_per_second']:.0f} ticks/s), "
+        f"level {game.level}, score {game.score}"
+    )
+    print(f"seed {game.seed} state {game.state_digest()}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # pygame and the game modules are imported here rather than at the top
+    # so the report can time them and --help doesn't pay for them.
+    started = time.perf_counter()
+    from game.game import Game
+    from game.replay import ReplayInput
+
+    imported = time.perf_counter() - started
+    if args.replay:
+        input_source = ReplayInput(args.replay)
+        seed, tick_rate = input_source.seed, input_source.tick_rate
+    else:
+        seed = args.seed if args.seed is not None else Game.new_seed()
+        tick_rate = args.tick_rate
+        input_source = build_input(args, seed, tick_rate)
+
+    game = Game(
+        render_mode=args.render_mode,
+        tick_rate=tick_rate,
+        max_fps=args.max_fps,
+        headless=args.headless,
+        input_source=input_source,
+        profile=args.profile,
+        trace_path=args.trace,
+        seed=seed,
+        startup_report=args.startup_report,
+    )
+    game.startup["import"] = imported
+    if args.headless:
+        run_headless(args, game)
+        return
     while game.running:
-        game.spawn_power_up()
         game.run()
     game.quit()
 
@@ -0,0 +1,245 @@
+"""Thin UDP client: sends input, renders the server's snapshots.
+
+Usage:
+    python -m net.client --server 127.0.0.1:47000
+    python -m net.client --latency 80 --loss 0.05
+"""
+
+import argparse
+import socket
+import sys
+import time
+from collections import OrderedDict
+
+import pygame
+
+from entities.player import Player
+from game.controls import KeyboardInput
+from game.renderer import Renderer
+from utils.sprites import circle_sprite
+from utils.text import TextCache
+from utils.world import WORLD_SIZE
+
+from . import protocol
+from .link import Link
+from .server import PLAYER_COLORS
+
+
+class GameClient:
+    """Connection to a GameServer that tracks the newest world state.
+
+    Decoded states are kept for the last ``history`` ticks, since the
+    server may delta-code against any of them. The tick of the newest one
+    is acknowledged with every INPUT datagram.
+    """
+
+    def __init__(
+        self,
+        server=("127.0.0.1", 47000),
+        input_source=None,
+        history=64,
+        join_retry=0.5,
+        latency_ms=0,
+        jitter_ms=0,
+        loss=0.0,
+        seed=None,
+    ):
+        # Datagrams are matched against this address, so names such as
+        # "localhost" are resolved to the address replies come from.
+        host, port = server
+        self.server = (socket.gethostbyname(host), port)
+        self.input = input_source if input_source is not None else KeyboardInput()
+        self.link = Link(("", 0), latency_ms, jitter_ms, loss, seed=seed)
+        self.history = history
+        self.join_retry = join_retry
+        self.last_join = None
+        self.player_id = None
+        self.tick_rate = None
+        self.world_size = None
+        self.sequence = 0
+        self.states = OrderedDict()  # tick -> decoded state bytes
+        self.latest_tick = 0
+        self.world = None  # WorldState of latest_tick
+        self.bytes_received = 0
+        self.snapshots_received = 0
+        self.snapshots_skipped = 0  # Arrived after a newer one, or base lost
+
+    @property
+    def connected(self):
+        return self.player_id is not None
+
+    def update(self):
+        """Handle incoming datagrams and send this tick's input."""
+        for data, address in self.link.receive():
+            if address != self.server:
+                continue
+            self.bytes_received += len(data)
+            kind = data[:1]
+            if kind == protocol.SNAPSHOT:
+                self.on_snapshot(data)
+            elif kind == protocol.WELCOME:
+                _, player_id, tick_rate, width, height = (
+                    protocol.WELCOME_PACKET.unpack(data)
+                )
+                self.player_id = player_id
+                self.tick_rate = tick_rate
+                self.world_size = (width, height)
+                self.states.clear()
+                self.latest_tick = 0
+
+        now = time.perf_counter()
+        if not self.connected:
+            if self.last_join is None or now - self.last_join >= self.join_retry:
+                self.last_join = now
+                self.link.send(protocol.JOIN, self.server)
+        else:
+            controls = self.input.poll()
+            self.sequence += 1
+            self.link.send(
+                protocol.encode_input(self.sequence, self.latest_tick, controls),
+                self.server,
+            )
+        self.link.flush()
+
+    def on_snapshot(self, packet):
+        decoded = protocol.decode_snapshot(packet, self.states)
+        if decoded is None:
+            self.snapshots_skipped += 1
+            return
+        tick, state = decoded
+        self.snapshots_received += 1
+        self.states[tick] = state
+        while len(self.states) > self.history:
+            self.states.popitem(last=False)
+        if tick > self.latest_tick:
+            self.latest_tick = tick
+            self.world = protocol.decode_state(state)
+        else:
+            self.snapshots_skipped += 1
+
+    def leave(self):
+        if self.connected:
+            self.link.send(protocol.LEAVE, self.server)
+        self.link.flush()
+        self.player_id = None
+
+    def close(self):
+        self.leave()
+        self.input.close()
+        self.link.close()
+
+
+class WorldView:
+    """Draws a WorldState with the game's own sprites."""
+
+    def __init__(self):
+        self.text = TextCache()
+        self.ships = {}  # player id -> Player used only for drawing
+
+    def draw(self, screen, world, player_id):
+        screen.fill((0, 0, 0))
+        if world is None:
+            text = self.text.render("Connecting...", 36, (255, 255, 255))
+            screen.blit(text, text.get_rect(center=screen.get_rect().center))
+            return
+        sprites = [
+            (circle_sprite(int(size), tuple(color))[0], (x - size / 2, y - size / 2))
+            for (x, y), size, color in zip(
+                world.asteroid_positions.tolist(),
+                world.asteroid_sizes.tolist(),
+                world.asteroid_colors.tolist(),
+            )
+        ]
+        bullet = circle_sprite(10, (255, 255, 255))[0]
+        sprites.extend((bullet, (x - 5, y - 5)) for x, y in world.bullet_positions)
+        power_up = circle_sprite(20, (255, 255, 0))[0]
+        sprites.extend(
+            (power_up, (x - 10, y - 10)) for x, y in world.power_up_positions
+        )
+        screen.blits(sprites, doreturn=False)
+
+        for row in world.players:
+            ship = self._ship(int(row["id"]))
+            ship.position.update(
+                row["x"] / protocol.POSITION_SCALE, row["y"] / protocol.POSITION_SCALE
+            )
+            ship.angle = row["angle"] / protocol.ANGLE_SCALE
+            ship.thrusting = bool(row["flags"] & protocol.FLAG_THRUSTING)
+            ship.draw(screen)
+            if int(row["id"]) == player_id:
+                hud = f"Score: {int(row['score'])}  Lives: {int(row['lives'])}"
+                screen.blit(self.text.render(hud, 36, (255, 255, 255)), (10, 10))
+        level = self.text.render(f"Level {world.level}", 36, (255, 255, 255))
+        screen.blit(level, (10, 50))
+
+    def _ship(self, player_id):
+        ship = self.ships.get(player_id)
+        if ship is None:
+            color = PLAYER_COLORS[player_id % len(PLAYER_COLORS)]
+            ship = self.ships[player_id] = Player((0, 0), 50, color)
+        return ship
+
+
+def parse_address(text):
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server", type=parse_address, default=("127.0.0.1", 47000))
+    parser.add_argument("--latency", type=float, default=0, help="added delay, ms")
+    parser.add_argument("--jitter", type=float, default=0, help="delay spread, ms")
+    parser.add_argument("--loss", type=float, default=0.0, help="drop probability")
+    args = parser.parse_args(argv)
+
+    # Only the display is needed; fonts start with the first text drawn.
+    pygame.display.init()
+    pygame.display.set_caption("Asteroids Clone (online)")
+    # Frames are drawn at the server's world size (WORLD_SIZE until its
+    # WELCOME arrives) and scaled to the window like Game does.
+    world_size = WORLD_SIZE
+    window = pygame.display.set_mode(world_size, pygame.RESIZABLE)
+    renderer = Renderer()
+    screen = renderer.set_window(window, world_size)
+    fullscreen = False
+    client = GameClient(
+        args.server,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        loss=args.loss,
+    )
+    view = WorldView()
+    clock = pygame.time.Clock()
+    running = True
+    while running:
+        for event in pygame.event.get():
+            client.input.handle_event(event)
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEORESIZE and not fullscreen:
+                window = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+                screen = renderer.set_window(window, world_size)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                fullscreen = not fullscreen
+                if fullscreen:
+                    window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                else:
+                    window = pygame.display.set_mode(world_size, pygame.RESIZABLE)
+                screen = renderer.set_window(window, world_size)
+        client.update()
+        if client.world_size is not None and client.world_size != world_size:
+            world_size = client.world_size
+            if not fullscreen:
+                window = pygame.display.set_mode(world_size, pygame.RESIZABLE)
+            screen = renderer.set_window(window, world_size)
+        view.draw(screen, client.world, client.player_id)
+        renderer.present(screen, [screen.get_rect()])
+        clock.tick(client.tick_rate or 60)
+    client.close()
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""UDP endpoint with optional simulated latency, jitter and packet loss."""
+
+import heapq
+import random
+import socket
+import time
+
+
+class Link:
+    """Non-blocking UDP socket that can impair its outgoing datagrams.
+
+    With latency or loss set, ``send`` queues each datagram (or drops it)
+    and ``flush`` releases the ones whose delivery time has come, so two
+    links on localhost behave like a real network path. Counters track
+    the datagrams and bytes that actually left.
+    """
+
+    def __init__(
+        self, address=("127.0.0.1", 0), latency_ms=0, jitter_ms=0, loss=0.0, seed=None
+    ):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(address)
+        self.socket.setblocking(False)
+        self.address = self.socket.getsockname()
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.queue = []  # (due time, sequence, data, address)
+        self.sequence = 0
+        self.packets_sent = 0
+        self.bytes_sent = 0
+        self.packets_dropped = 0
+
+    def send(self, data, address):
+        """Send data now, later or never, depending on the impairments."""
+        if self.loss and self.rng.random() < self.loss:
+            self.packets_dropped += 1
+            return
+        if not self.latency and not self.jitter:
+            self._send(data, address)
+            return
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+        self.sequence += 1
+        heapq.heappush(
+            self.queue,
+            (time.perf_counter() + max(0.0, delay), self.sequence, data, address),
+        )
+
+    def flush(self):
+        """Put every queued datagram that is due on the wire."""
+        now = time.perf_counter()
+        queue = self.queue
+        while queue and queue[0][0] <= now:
+            _, _, data, address = heapq.heappop(queue)
+            self._send(data, address)
+
+    def receive(self):
+        """Yield (data, address) for every datagram waiting on the socket."""
+        while True:
+            try:
+                yield self.socket.recvfrom(65535)
+            except (BlockingIOError, ConnectionResetError):
+                return
+
+    def close(self):
+        self.socket.close()
+
+    def _send(self, data, address):
+        try:
+            self.socket.sendto(data, address)
+        except (BlockingIOError, ConnectionRefusedError):
+            self.packets_dropped += 1
+            return
+        self.packets_sent += 1
+        self.bytes_sent += len(data)
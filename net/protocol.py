@@ -0,0 +1,192 @@
+"""Datagram formats shared by the game server and its clients.
+
+Client to server::
+
+    JOIN      type
+    INPUT     type, input sequence, last snapshot tick received, controls
+    LEAVE     type
+
+Server to client::
+
+    WELCOME   type, player id, tick rate, world width, world height
+    SNAPSHOT  type, tick, base tick (0 = none), state size, zlib payload
+
+A state is the whole visible world, quantized (positions to 1/4 pixel)
+and laid out column by column so that consecutive ticks differ in as few
+bytes as possible. A snapshot's payload is the state XORed with the base
+state the client last acknowledged, then compressed; unchanged bytes XOR
+to zero runs that zlib squeezes away.
+"""
+
+import struct
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+from entities.powerup import POWER_UP_TYPES
+from game.replay import encode_controls
+
+JOIN = b"J"
+WELCOME = b"W"
+INPUT = b"I"
+SNAPSHOT = b"S"
+LEAVE = b"L"
+
+WELCOME_PACKET = struct.Struct("<cHHHH")
+INPUT_PACKET = struct.Struct("<cIIB")
+SNAPSHOT_HEADER = struct.Struct("<cIII")
+
+# Largest payload that fits a UDP datagram.
+MAX_DATAGRAM = 65507
+
+POSITION_SCALE = 4  # Fixed-point steps per pixel
+ANGLE_SCALE = 100  # Fixed-point steps per degree
+
+_STATE_HEADER = struct.Struct("<IHHHHH")  # tick, level, then entity counts
+_PLAYER_DTYPE = np.dtype(
+    [
+        ("id", "<u2"),
+        ("x", "<i2"),
+        ("y", "<i2"),
+        ("angle", "<u2"),
+        ("lives", "u1"),
+        ("flags", "u1"),  # bit 0 thrusting, bit 1 invulnerable
+        ("score", "<i4"),
+    ]
+)
+FLAG_THRUSTING = 1
+FLAG_INVULNERABLE = 2
+
+WorldState = namedtuple(
+    "WorldState",
+    "tick level players asteroid_positions asteroid_sizes asteroid_colors "
+    "bullet_positions power_up_positions power_up_types",
+)
+
+
+def encode_state(game):
+    """Quantize a ServerGame's visible state into bytes."""
+    asteroids = game.asteroids
+    count = len(asteroids)
+    players = np.zeros(len(game.players), dtype=_PLAYER_DTYPE)
+    pools = []
+    now = game.time_ms
+    for row, (player_id, player) in enumerate(game.players.items()):
+        flags = FLAG_THRUSTING if player.thrusting else 0
+        if player.is_invulnerable(now):
+            flags |= FLAG_INVULNERABLE
+        players[row] = (
+            player_id,
+            _fixed(player.position.x),
+            _fixed(player.position.y),
+            round(player.angle % 360 * ANGLE_SCALE) % (360 * ANGLE_SCALE),
+            min(player.lives, 255),
+            flags,
+            game.scores[player_id],
+        )
+        pools.append(player.bullets.positions[: len(player.bullets)])
+    bullets = np.concatenate(pools) if pools else np.zeros((0, 2))
+    power_ups = list(game.power_ups)
+
+    return b"".join(
+        (
+            _STATE_HEADER.pack(
+                game.ticks,
+                game.level,
+                len(players),
+                count,
+                len(bullets),
+                len(power_ups),
+            ),
+            players.tobytes(),
+            _columns(asteroids.positions[:count]),
+            asteroids.sizes[:count].astype(np.uint8).tobytes(),
+            asteroids.colors[:count].T.tobytes(),
+            _columns(bullets),
+            _columns(np.array([tuple(p.position) for p in power_ups]).reshape(-1, 2)),
+            bytes(POWER_UP_TYPES.index(p.power_type) for p in power_ups),
+        )
+    )
+
+
+def decode_state(data):
+    """Turn bytes from encode_state back into a WorldState of arrays."""
+    tick, level, players, asteroids, bullets, power_ups = _STATE_HEADER.unpack_from(
+        data
+    )
+    reader = _Reader(data, _STATE_HEADER.size)
+    return WorldState(
+        tick,
+        level,
+        reader.array(_PLAYER_DTYPE, players),
+        reader.positions(asteroids),
+        reader.array(np.uint8, asteroids),
+        reader.array(np.uint8, 3 * asteroids).reshape(3, asteroids).T,
+        reader.positions(bullets),
+        reader.positions(power_ups),
+        [POWER_UP_TYPES[kind] for kind in reader.array(np.uint8, power_ups)],
+    )
+
+
+def encode_snapshot(tick, state, base_tick=0, base=None):
+    """Build a SNAPSHOT datagram, delta-coded against base when given."""
+    payload = state if base is None else xor_bytes(state, base)
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT, tick, base_tick, len(state))
+    return header + zlib.compress(payload, 1)
+
+
+def decode_snapshot(packet, bases):
+    """Return (tick, state bytes) from a SNAPSHOT, or None if its base is gone.
+
+    ``bases`` maps tick to previously decoded state bytes.
+    """
+    _, tick, base_tick, size = SNAPSHOT_HEADER.unpack_from(packet)
+    payload = zlib.decompress(packet[SNAPSHOT_HEADER.size :])
+    if base_tick:
+        base = bases.get(base_tick)
+        if base is None:
+            return None
+        payload = xor_bytes(payload, base)
+    if len(payload) != size:
+        raise ValueError("corrupt snapshot")
+    return tick, payload
+
+
+def encode_input(sequence, ack, controls):
+    """Build an INPUT datagram carrying one tick of Controls."""
+    return INPUT_PACKET.pack(INPUT, sequence, ack, encode_controls(controls))
+
+
+def xor_bytes(data, base):
+    """XOR data with base, treating base as zero-padded or truncated to fit."""
+    current = np.frombuffer(data, dtype=np.uint8)
+    reference = np.zeros(len(current), dtype=np.uint8)
+    overlap = min(len(current), len(base))
+    reference[:overlap] = np.frombuffer(base, dtype=np.uint8, count=overlap)
+    return (current ^ reference).tobytes()
+
+
+def _fixed(value):
+    return int(max(-32768, min(32767, round(value * POSITION_SCALE))))
+
+
+def _columns(positions):
+    # All x values, then all y values.
+    fixed = np.clip(np.rint(positions * POSITION_SCALE), -32768, 32767)
+    return fixed.astype("<i2").T.tobytes()
+
+
+class _Reader:
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+
+    def array(self, dtype, count):
+        array = np.frombuffer(self.data, dtype=dtype, count=count, offset=self.offset)
+        self.offset += array.nbytes
+        return array
+
+    def positions(self, count):
+        columns = self.array("<i2", 2 * count).reshape(2, count)
+        return columns.T / POSITION_SCALE
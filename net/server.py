@@ -0,0 +1,320 @@
+"""Authoritative headless game server over UDP.
+
+Clients join, stream one INPUT datagram per tick and receive a SNAPSHOT
+of the world after every server tick, delta-coded against the newest
+snapshot they have acknowledged.
+
+Usage:
+    python -m net.server --port 47000 --seed 1
+    python -m net.server --latency 50 --jitter 10 --loss 0.05
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections import OrderedDict, deque
+
+import pygame
+
+from entities.player import Player
+from game.controls import NO_CONTROLS
+from game.game import Game
+from game.replay import decode_controls
+
+from . import protocol
+from .link import Link
+
+# Ship colors handed out by player id.
+PLAYER_COLORS = (
+    (255, 255, 255),
+    (0, 200, 255),
+    (255, 120, 200),
+    (120, 255, 120),
+    (255, 200, 0),
+    (180, 140, 255),
+)
+
+
+class ServerGame(Game):
+    """Headless Game that simulates one ship per connected player.
+
+    Asteroids, power-ups and levels are shared. A hit costs the ship a life
+    and respawns it in the middle; a ship with no lives left sits out until
+    its player joins again.
+    """
+
+    def __init__(self, seed=None, tick_rate=60, **options):
+        self.players = {}  # player id -> Player
+        self.scores = {}
+        self.controls = {}  # player id -> Controls for the next tick
+        super().__init__(headless=True, seed=seed, tick_rate=tick_rate, **options)
+
+    def add_player(self, player_id):
+        """Give player_id a fresh ship in the middle of the world."""
+        color = PLAYER_COLORS[player_id % len(PLAYER_COLORS)]
+        player = Player(self.world_center(), 50, color, bounds=self.world_size)
+        player.last_hit_time = self.time_ms  # Spawn protection
+        self.players[player_id] = player
+        self.scores[player_id] = 0
+        self.controls[player_id] = NO_CONTROLS
+        return player
+
+    def remove_player(self, player_id):
+        self.players.pop(player_id, None)
+        self.scores.pop(player_id, None)
+        self.controls.pop(player_id, None)
+
+    def update(self):
+        self.ticks += 1
+        players = [
+            (player_id, player)
+            for player_id, player in self.players.items()
+            if player.lives > 0
+        ]
+        for player_id, player in players:
+            controls = self.controls[player_id]
+            player.update(controls, self.dt)
+            if controls.shoot:
+                player.shoot()
+        self.asteroids.update(self.dt)
+
+        pools = [player.bullets for _, player in players]
+        self.index_asteroids(pools)
+        for player_id, player in players:
+            hits = self.resolve_bullet_hits(player.bullets)
+            if hits:
+                self.scores[player_id] += 10 * hits
+                self.index_asteroids(pools)  # Rows moved; later pools need a fresh grid
+
+        now = self.time_ms
+        for _, player in players:
+            asteroid = self.asteroid_hitting(player)
+            if asteroid is not None and not player.is_invulnerable(now):
+                player.lives -= 1
+                player.last_hit_time = now
+                player.position = pygame.Vector2(self.world_center())
+                player.previous_position = pygame.Vector2(self.world_center())
+                player.velocity = pygame.Vector2(0, 0)
+
+        self.power_ups.update(self.ticks)
+        for _, player in players:
+            self.check_power_up_collection(player)
+        if not self.asteroids:
+            self.next_level()
+
+    def entity_counts(self):
+        return {
+            "players": len(self.players),
+            "asteroids": len(self.asteroids),
+            "bullets": sum(len(player.bullets) for player in self.players.values()),
+            "power_ups": len(self.power_ups),
+        }
+
+
+class RemoteClient:
+    """Server-side bookkeeping for one connected address."""
+
+    def __init__(self, player_id, address, tick):
+        self.player_id = player_id
+        self.address = address
+        self.acked = 0  # Newest snapshot tick the client confirmed
+        self.sequence = 0  # Newest input sequence applied
+        self.last_heard = tick
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+        self.delta_snapshots = 0
+
+
+class GameServer:
+    """Runs a ServerGame at a fixed tick rate for UDP clients.
+
+    The last ``history`` encoded states are kept so each client can be sent
+    a delta against whatever it last acknowledged; a client whose ack has
+    fallen out of the history gets a full state instead.
+    """
+
+    def __init__(
+        self,
+        address=("127.0.0.1", 47000),
+        seed=None,
+        tick_rate=60,
+        max_players=32,
+        history=64,
+        timeout=5.0,
+        latency_ms=0,
+        jitter_ms=0,
+        loss=0.0,
+    ):
+        self.game = ServerGame(seed=seed, tick_rate=tick_rate)
+        self.link = Link(address, latency_ms, jitter_ms, loss, seed=seed)
+        self.address = self.link.address
+        self.max_players = max_players
+        self.timeout_ticks = round(timeout * tick_rate)
+        self.clients = {}  # address -> RemoteClient
+        self.next_player_id = 1
+        self.states = OrderedDict()  # tick -> encoded state
+        self.history = history
+        self.tick_times = deque(maxlen=tick_rate * 10)
+        self.oversized = 0  # Snapshots too big for one datagram
+        self.running = True
+
+    def receive(self):
+        """Apply every pending datagram from clients."""
+        tick = self.game.ticks
+        for data, address in self.link.receive():
+            kind = data[:1]
+            client = self.clients.get(address)
+            if kind == protocol.INPUT and client is not None:
+                if len(data) != protocol.INPUT_PACKET.size:
+                    continue
+                _, sequence, ack, controls = protocol.INPUT_PACKET.unpack(data)
+                client.last_heard = tick
+                client.acked = max(client.acked, ack)
+                # Datagrams can arrive out of order; only newer input counts.
+                if sequence > client.sequence:
+                    client.sequence = sequence
+                    self.game.controls[client.player_id] = decode_controls(controls)
+            elif kind == protocol.JOIN:
+                self.join(address)
+            elif kind == protocol.LEAVE and client is not None:
+                self.drop(address)
+
+    def join(self, address):
+        """Add (or respawn) the player at address and send WELCOME."""
+        client = self.clients.get(address)
+        if client is None:
+            if len(self.clients) >= self.max_players:
+                return
+            client = RemoteClient(self.next_player_id, address, self.game.ticks)
+            self.next_player_id += 1
+            self.clients[address] = client
+        client.acked = 0
+        self.game.add_player(client.player_id)
+        width, height = self.game.world_size
+        self.link.send(
+            protocol.WELCOME_PACKET.pack(
+                protocol.WELCOME,
+                client.player_id,
+                self.game.tick_rate,
+                width,
+                height,
+            ),
+            address,
+        )
+
+    def drop(self, address):
+        client = self.clients.pop(address)
+        self.game.remove_player(client.player_id)
+
+    def step(self):
+        """Receive input, advance one tick and send every client a snapshot."""
+        self.receive()
+        start = time.perf_counter()
+        game = self.game
+        game.update()
+        tick = game.ticks
+        state = protocol.encode_state(game)
+        self.states[tick] = state
+        while len(self.states) > self.history:
+            self.states.popitem(last=False)
+        full = protocol.encode_snapshot(tick, state)
+
+        for address, client in list(self.clients.items()):
+            if tick - client.last_heard > self.timeout_ticks:
+                self.drop(address)
+                continue
+            # A stale base can XOR into noise that compresses worse than
+            # the plain state, so the smaller of the two is sent.
+            packet = full
+            base = self.states.get(client.acked)
+            if base is not None:
+                delta = protocol.encode_snapshot(tick, state, client.acked, base)
+                if len(delta) < len(full):
+                    packet = delta
+                    client.delta_snapshots += 1
+            if len(packet) > protocol.MAX_DATAGRAM:
+                self.oversized += 1
+                continue
+            client.bytes_sent += len(packet)
+            client.snapshots_sent += 1
+            self.link.send(packet, address)
+        self.tick_times.append(time.perf_counter() - start)
+        self.link.flush()
+
+    def run(self, seconds=None):
+        """Tick in real time until stopped (or for ``seconds``)."""
+        step = 1.0 / self.game.tick_rate
+        next_tick = time.perf_counter()
+        stop = None if seconds is None else next_tick + seconds
+        while self.running and (stop is None or next_tick < stop):
+            self.step()
+            next_tick += step
+            # Keep releasing delayed datagrams while waiting for the tick.
+            while (delay := next_tick - time.perf_counter()) > 0:
+                time.sleep(min(delay, 0.001))
+                self.link.flush()
+
+    def stats(self):
+        """Tick cost and per-client bandwidth over the recent ticks."""
+        times = sorted(self.tick_times) or [0.0]
+        tick_rate = self.game.tick_rate
+        clients = list(self.clients.values())
+        rates = [
+            client.bytes_sent * tick_rate / client.snapshots_sent
+            for client in clients
+            if client.snapshots_sent
+        ]
+        return {
+            "ticks": self.game.ticks,
+            "players": len(clients),
+            "tick_ms_p50": statistics.median(times) * 1000,
+            "tick_ms_p95": times[int(len(times) * 0.95)] * 1000,
+            "bytes_per_client_per_s": statistics.fmean(rates) if rates else 0.0,
+            "delta_ratio": (
+                sum(client.delta_snapshots for client in clients)
+                / max(1, sum(client.snapshots_sent for client in clients))
+            ),
+            "packets_dropped": self.link.packets_dropped,
+            "oversized": self.oversized,
+        }
+
+    def close(self):
+        self.link.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=47000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument("--max-players", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=None, help="stop after")
+    parser.add_argument("--latency", type=float, default=0, help="added delay, ms")
+    parser.add_argument("--jitter", type=float, default=0, help="delay spread, ms")
+    parser.add_argument("--loss", type=float, default=0.0, help="drop probability")
+    args = parser.parse_args(argv)
+
+    server = GameServer(
+        (args.host, args.port),
+        seed=args.seed,
+        tick_rate=args.tick_rate,
+        max_players=args.max_players,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        loss=args.loss,
+    )
+    print(f"serving on {server.address[0]}:{server.address[1]}", file=sys.stderr)
+    try:
+        server.run(args.seconds)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    print(server.stats(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
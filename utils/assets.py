@@ -0,0 +1,136 @@
+"""Shared asset registry for the game."""
+
+import os
+import threading
+import time
+
+import pygame
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+
+SOUND_FILES = {
+    "explosion": os.path.join("sounds", "explosion.mp3"),
+    "laser": os.path.join("sounds", "laser.mp3"),
+    "engine": os.path.join("sounds", "engine.mp3"),
+}
+
+
+class NullSound:
+    """Stand-in for pygame.mixer.Sound when running without audio."""
+
+    def play(self, loops=0, maxtime=0, fade_ms=0):
+        return None
+
+    def stop(self):
+        pass
+
+    def fadeout(self, time):
+        pass
+
+    def set_volume(self, value):
+        pass
+
+    def get_volume(self):
+        return 0.0
+
+    def get_num_channels(self):
+        return 0
+
+    def get_length(self):
+        return 0.0
+
+
+class AssetRegistry:
+    """Loads each asset once and hands out the shared instance."""
+
+    def __init__(self, sound_files=None, silent=False):
+        self.sound_files = dict(SOUND_FILES if sound_files is None else sound_files)
+        # When silent, nothing is decoded and every sound is a NullSound.
+        self.silent = silent
+        self.sounds = {}
+        self.load_times = {}
+        self.sizes = {}
+        self.preload_seconds = None  # Wall time of the last finished preload
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def preload(self, background=False):
+        """Load every registered sound, optionally on a background thread."""
+        if self.silent:
+            return
+        if not background:
+            self._load_all()
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._load_all, name="asset-preload", daemon=True
+            )
+            self._thread.start()
+
+    def wait(self):
+        """Block until a background preload has finished."""
+        if self._thread is not None:
+            self._thread.join()
+
+    def get_sound(self, name):
+        """Return the shared Sound for name, loading it on first use."""
+        if self.silent:
+            return NULL_SOUND
+        sound = self.sounds.get(name)
+        if sound is None:
+            sound = self._load_sound(name)
+        return sound
+
+    def silence(self):
+        """Stop loading audio; every later get_sound returns a NullSound."""
+        self.silent = True
+
+    def report(self):
+        """Return load time (seconds) and decoded size (bytes) per asset."""
+        return {
+            name: {"seconds": self.load_times[name], "bytes": self.sizes[name]}
+            for name in self.sounds
+        }
+
+    def total_bytes(self):
+        """Return the decoded size of every loaded asset."""
+        return sum(self.sizes.values())
+
+    def _load_all(self):
+        start = time.perf_counter()
+        for name in self.sound_files:
+            self._load_sound(name)
+        self.preload_seconds = time.perf_counter() - start
+
+    def _load_sound(self, name):
+        # The lock keeps a background preload and a first use on the main
+        # thread from decoding the same file twice.
+        with self._lock:
+            sound = self.sounds.get(name)
+            if sound is not None:
+                return sound
+            start = time.perf_counter()
+            sound = pygame.mixer.Sound(os.path.join(ASSET_DIR, self.sound_files[name]))
+            self.load_times[name] = time.perf_counter() - start
+            self.sizes[name] = _sound_bytes(sound)
+            self.sounds[name] = sound
+            return sound
+
+
+def _sound_bytes(sound):
+    """Estimate the decoded size of a Sound from the mixer format."""
+    mixer_format = pygame.mixer.get_init()
+    if mixer_format is None:
+        return 0
+    frequency, sample_format, channels = mixer_format
+    return int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+
+
+NULL_SOUND = NullSound()
+
+registry = AssetRegistry()
+
+
+def get_sound(name):
+    """Return the shared Sound registered under name."""
+    return registry.get_sound(name)
@@ -0,0 +1,164 @@
+"""Mixer voice management: per-category channels, rate limits and stealing.
+
+Every sound belongs to a category that owns a fixed set of reserved mixer
+channels, so a burst of explosions can never take the channels the laser
+or engine need. Repeats of the same one-shot inside its window are
+coalesced into the voice already playing, and when a category is full the
+lowest-priority, oldest voice is stolen (or the new sound is dropped if
+everything playing outranks it).
+"""
+
+from collections import namedtuple
+
+import pygame
+
+from .assets import NullSound, registry
+
+# Reserved mixer channels per category.
+CATEGORIES = {"weapons": 3, "explosions": 4, "engine": 1}
+
+SoundSpec = namedtuple("SoundSpec", "category priority window_ms")
+
+SOUNDS = {
+    "laser": SoundSpec("weapons", priority=1, window_ms=50),
+    "explosion": SoundSpec("explosions", priority=2, window_ms=60),
+    "engine": SoundSpec("engine", priority=3, window_ms=0),
+}
+
+COUNTERS = ("played", "coalesced", "stolen", "dropped")
+
+
+class NullAudio:
+    """Audio backend that plays nothing, for headless runs."""
+
+    def play(self, name, now):
+        return None
+
+    def loop(self, name, playing):
+        pass
+
+    def stop_all(self):
+        pass
+
+    def voices(self):
+        return 0
+
+    def stats(self):
+        return dict.fromkeys(COUNTERS, 0)
+
+
+class AudioManager:
+    """Plays registered sounds on budgeted, prioritised mixer channels.
+
+    ``now`` arguments are in milliseconds; the game passes its simulated
+    clock so rate limits follow the simulation rather than the frame rate.
+    """
+
+    def __init__(self, categories=None, sounds=None, assets=registry):
+        self.categories = dict(CATEGORIES if categories is None else categories)
+        self.sounds = dict(SOUNDS if sounds is None else sounds)
+        self.assets = assets
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.last_played = {}  # name -> time of the last voice started
+        self.looping = {}  # name -> channel of a running loop
+        self.channels = None  # category -> [[channel, priority, started]]
+
+    def play(self, name, now):
+        """Start a one-shot; return its Channel, or None if it was skipped."""
+        spec = self.sounds[name]
+        sound = self.assets.get_sound(name)
+        if isinstance(sound, NullSound):
+            return None
+        last = self.last_played.get(name)
+        # Simulated time jumps back after a reset, load or rewind; an
+        # earlier ``now`` never counts as a repeat.
+        if last is not None and 0 <= now - last < spec.window_ms:
+            self.counters["coalesced"] += 1
+            return None
+        voice = self._claim(spec, now)
+        if voice is None:
+            self.counters["dropped"] += 1
+            return None
+        self.last_played[name] = now
+        self.counters["played"] += 1
+        voice[0].play(sound)
+        return voice[0]
+
+    def loop(self, name, playing):
+        """Keep a looping sound running while ``playing`` is true."""
+        channel = self.looping.get(name)
+        if playing and channel is None:
+            spec = self.sounds[name]
+            sound = self.assets.get_sound(name)
+            if isinstance(sound, NullSound):
+                return  # Silenced registry: nothing to loop
+            voice = self._claim(spec, 0)
+            if voice is None:
+                self.counters["dropped"] += 1
+                return
+            self.counters["played"] += 1
+            voice[0].play(sound, loops=-1)
+            self.looping[name] = voice[0]
+        elif not playing and channel is not None:
+            channel.stop()
+            del self.looping[name]
+
+    def stop_all(self):
+        """Silence every channel the manager owns."""
+        for voices in (self.channels or {}).values():
+            for voice in voices:
+                voice[0].stop()
+        self.looping.clear()
+
+    def voices(self):
+        """Return how many managed channels are currently playing."""
+        return sum(
+            voice[0].get_busy()
+            for voices in (self.channels or {}).values()
+            for voice in voices
+        )
+
+    def stats(self):
+        """Return the played/coalesced/stolen/dropped counters."""
+        return dict(self.counters)
+
+    def _claim(self, spec, now):
+        # A free channel if there is one, otherwise the weakest voice of
+        # the category, provided it doesn't outrank the new sound.
+        voices = self._voices(spec.category)
+        victim = None
+        for voice in voices:
+            channel, priority, started = voice
+            if not channel.get_busy():
+                victim = voice
+                break
+            if victim is None or (priority, started) < (victim[1], victim[2]):
+                victim = voice
+        else:
+            if victim is None or victim[1] > spec.priority:
+                return None
+            victim[0].stop()
+            self.counters["stolen"] += 1
+        victim[1] = spec.priority
+        victim[2] = now
+        return victim
+
+    def _voices(self, category):
+        if self.channels is None:
+            self._reserve()
+        return self.channels[category]
+
+    def _reserve(self):
+        # Claimed on first use, once the mixer is initialised. Reserved
+        # channels are skipped by Sound.play, so nothing else can take them.
+        total = sum(self.categories.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        self.channels = {}
+        index = 0
+        for category, count in self.categories.items():
+            self.channels[category] = [
+                [pygame.mixer.Channel(index + offset), 0, 0] for offset in range(count)
+            ]
+            index += count
@@ -0,0 +1,114 @@
+"""Uniform-grid spatial hash used as a collision broadphase."""
+
+import numpy as np
+
+
+class SpatialHash:
+    """Buckets items by the grid cells their bounding box overlaps."""
+
+    def __init__(self, cell_size=80):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Remove every item from the grid."""
+        self.cells.clear()
+
+    def insert(self, item, x, y, radius):
+        """Add item to every cell its bounding box touches."""
+        cells = self.cells
+        for key in self._cell_keys(x, y, radius):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [item]
+            else:
+                bucket.append(item)
+
+    def insert_many(self, items, positions, radii):
+        """Add many items at once; each circle must be no wider than a cell.
+
+        Cells are computed and grouped with NumPy, so the Python work is
+        per occupied cell rather than per item.
+        """
+        items = np.asarray(items)
+        if not len(items):
+            return
+        keys = corner_cell_keys(positions, radii, self.cell_size)
+        # Boxes inside one cell along an axis repeat their corners.
+        keep = np.ones(keys.shape, dtype=bool)
+        keep[:, 1] = keys[:, 1] != keys[:, 0]
+        keep[:, 2] = keys[:, 2] != keys[:, 0]
+        keep[:, 3] = (keys[:, 3] != keys[:, 1]) & (keys[:, 3] != keys[:, 2])
+        flat_keys = keys[keep]
+        flat_items = np.broadcast_to(items[:, None], keys.shape)[keep]
+        order = np.argsort(flat_keys, kind="stable")
+        flat_keys = flat_keys[order]
+        starts = np.flatnonzero(np.diff(flat_keys)) + 1
+        groups = np.split(flat_items[order], starts)
+        firsts = flat_keys[np.concatenate(([0], starts))]
+        cxs = (firsts + (1 << 31)) >> 32
+        cys = firsts - (cxs << 32)
+        cells = self.cells
+        for cx, cy, group in zip(cxs.tolist(), cys.tolist(), groups):
+            bucket = cells.get((cx, cy))
+            if bucket is None:
+                cells[cx, cy] = group.tolist()
+            else:
+                bucket.extend(group.tolist())
+
+    def remove(self, item, x, y, radius):
+        """Take item out of the cells it was inserted into with these bounds."""
+        cells = self.cells
+        for key in self._cell_keys(x, y, radius):
+            bucket = cells.get(key)
+            if bucket is None:
+                continue
+            bucket.remove(item)
+            if not bucket:
+                del cells[key]
+
+    def query(self, x, y, radius):
+        """Return the set of items whose cells overlap the given circle's box."""
+        found = set()
+        cells = self.cells
+        for key in self._cell_keys(x, y, radius):
+            bucket = cells.get(key)
+            if bucket is not None:
+                found.update(bucket)
+        return found
+
+    def _cell_keys(self, x, y, radius):
+        size = self.cell_size
+        min_cx = int((x - radius) // size)
+        max_cx = int((x + radius) // size)
+        min_cy = int((y - radius) // size)
+        max_cy = int((y + radius) // size)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                yield cx, cy
+
+
+def corner_cell_keys(positions, radii, cell_size):
+    """Return an (n, 4) array of integer keys for each box's corner cells.
+
+    The box of a circle no wider than a cell spans at most two cells per
+    axis, so its corner cells are every cell it touches (the ones
+    SpatialHash.insert would use). Keys of equal cells compare equal.
+    """
+    radii = np.asarray(radii, dtype=float).reshape(-1, 1)
+    low = np.floor_divide(positions - radii, cell_size).astype(np.int64)
+    high = np.floor_divide(positions + radii, cell_size).astype(np.int64)
+    return np.stack(
+        [
+            _cell_key(low[:, 0], low[:, 1]),
+            _cell_key(low[:, 0], high[:, 1]),
+            _cell_key(high[:, 0], low[:, 1]),
+            _cell_key(high[:, 0], high[:, 1]),
+        ],
+        axis=1,
+    )
+
+
+def _cell_key(cx, cy):
+    # Exact for cell coordinates within +-2**31, far beyond any playfield.
+    return (cx << 32) + cy
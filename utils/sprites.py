@@ -0,0 +1,77 @@
+"""Interned sprites and collision masks shared between entities."""
+
+import pygame
+
+
+class RotationAtlas:
+    """Copies of a sprite and its mask pre-rotated in fixed angle steps."""
+
+    def __init__(self, image, step):
+        self.step = step
+        self.frames = []
+        for index in range(round(360 / step)):
+            # Angles grow clockwise on screen, pygame rotates counter-clockwise.
+            rotated = pygame.transform.rotate(image, -index * step)
+            self.frames.append((rotated, pygame.mask.from_surface(rotated)))
+
+    def index(self, angle):
+        """Return the frame index nearest to angle (in degrees)."""
+        return round(angle / self.step) % len(self.frames)
+
+    def frame(self, angle):
+        """Return the (image, mask) pair nearest to angle."""
+        return self.frames[self.index(angle)]
+
+
+class SpriteCache:
+    """Builds each (shape, size, color) sprite once and shares it."""
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def circle(self, diameter, color):
+        """Return the shared (image, mask) pair for a filled circle."""
+        key = ("circle", diameter, tuple(color))
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        image = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        radius = diameter // 2
+        pygame.draw.circle(image, color, (radius, radius), radius)
+        entry = (image, pygame.mask.from_surface(image))
+        self.entries[key] = entry
+        return entry
+
+    def rotations(self, key, image, step):
+        """Return the shared RotationAtlas for key, building it from image."""
+        key = ("rotations", key, step)
+        atlas = self.entries.get(key)
+        if atlas is not None:
+            self.hits += 1
+            return atlas
+        self.misses += 1
+        atlas = RotationAtlas(image, step)
+        self.entries[key] = atlas
+        return atlas
+
+    def stats(self):
+        """Return hit/miss counters and the number of interned sprites."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+    def clear(self):
+        """Drop every interned sprite and reset the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+sprite_cache = SpriteCache()
+
+
+def circle_sprite(diameter, color):
+    """Return the shared (image, mask) pair for a filled circle."""
+    return sprite_cache.circle(diameter, color)
@@ -0,0 +1,43 @@
+"""Cached fonts and rendered text surfaces."""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """Keeps loaded fonts by size and rendered text by (text, size, color)."""
+
+    def __init__(self, max_surfaces=128):
+        self.max_surfaces = max_surfaces
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size):
+        """Return the default font at the given size, loading it once."""
+        font = self.fonts.get(size)
+        if font is None:
+            # The font module is only started once text is first drawn.
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, size, color):
+        """Return a rendered surface, re-rendering only unseen text."""
+        key = (text, size, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        # Evict the least recently used text, e.g. old score values.
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
@@ -0,0 +1,8 @@
+"""Size of the playfield the simulation runs in.
+
+Entities bounce, wrap and cull against these bounds rather than against
+the window, so resizing or going fullscreen never changes the game; the
+renderer scales the playfield to whatever window it is shown in.
+"""
+
+WORLD_SIZE = (1280, 800)